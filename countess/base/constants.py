@@ -7,20 +7,26 @@ This module contains all the constants used in the Enrich2 source code.
 
 
 import re
+import sys
 import collections
+from types import MappingProxyType
+
+import numpy as np
 
 
 #: Variant string for counting wild type sequences
-WILD_TYPE_VARIANT = "_wt"
+WILD_TYPE_VARIANT = sys.intern("_wt")
 
 
 #: Variant string for synonymous variants in 'synonymous' DataFrame
-SYNONYMOUS_VARIANT = "_sy"
+SYNONYMOUS_VARIANT = sys.intern("_sy")
 
 
 #: Logging constants
+LOG_QUEUE_MAXLEN = 100000
 CALLBACK = "callback"
 MESSAGE = "msg"
+ARGS = "args"
 KWARGS = "kwargs"
 
 
@@ -44,6 +50,22 @@ LOG_RATIOS_TABLE = "log_ratios"
 WEIGHTS_TABLE = "weights"
 
 
+#: Target number of bytes read from or written to an HDF5 table per chunk
+HDF5_CHUNK_BYTES = 1048576
+
+
+#: Target number of bytes collected before appending to an HDF5 table
+HDF5_APPEND_BYTES = 67108864
+
+
+#: Number of bytes read per block when hashing a file
+HASH_BLOCK_BYTES = 1048576
+
+
+#: Hash algorithm used to fingerprint input files in serialized configurations
+FILE_HASH_ALGORITHM = "blake2b"
+
+
 #: Element types
 VARIANTS = "variants"
 BARCODES = "barcodes"
@@ -65,125 +87,159 @@ PARENT = "parent"
 
 
 #: Standard codon table for translating wild type and variant DNA sequences
-CODON_TABLE = {
-    "TTT": "F",
-    "TCT": "S",
-    "TAT": "Y",
-    "TGT": "C",
-    "TTC": "F",
-    "TCC": "S",
-    "TAC": "Y",
-    "TGC": "C",
-    "TTA": "L",
-    "TCA": "S",
-    "TAA": "*",
-    "TGA": "*",
-    "TTG": "L",
-    "TCG": "S",
-    "TAG": "*",
-    "TGG": "W",
-    "CTT": "L",
-    "CCT": "P",
-    "CAT": "H",
-    "CGT": "R",
-    "CTC": "L",
-    "CCC": "P",
-    "CAC": "H",
-    "CGC": "R",
-    "CTA": "L",
-    "CCA": "P",
-    "CAA": "Q",
-    "CGA": "R",
-    "CTG": "L",
-    "CCG": "P",
-    "CAG": "Q",
-    "CGG": "R",
-    "ATT": "I",
-    "ACT": "T",
-    "AAT": "N",
-    "AGT": "S",
-    "ATC": "I",
-    "ACC": "T",
-    "AAC": "N",
-    "AGC": "S",
-    "ATA": "I",
-    "ACA": "T",
-    "AAA": "K",
-    "AGA": "R",
-    "ATG": "M",
-    "ACG": "T",
-    "AAG": "K",
-    "AGG": "R",
-    "GTT": "V",
-    "GCT": "A",
-    "GAT": "D",
-    "GGT": "G",
-    "GTC": "V",
-    "GCC": "A",
-    "GAC": "D",
-    "GGC": "G",
-    "GTA": "V",
-    "GCA": "A",
-    "GAA": "E",
-    "GGA": "G",
-    "GTG": "V",
-    "GCG": "A",
-    "GAG": "E",
-    "GGG": "G",
-}
-
-
-#: Conversions between single- and three-letter amino acid codes
-AA_CODES = {
-    "Ala": "A",
-    "A": "Ala",
-    "Arg": "R",
-    "R": "Arg",
-    "Asn": "N",
-    "N": "Asn",
-    "Asp": "D",
-    "D": "Asp",
-    "Cys": "C",
-    "C": "Cys",
-    "Glu": "E",
-    "E": "Glu",
-    "Gln": "Q",
-    "Q": "Gln",
-    "Gly": "G",
-    "G": "Gly",
-    "His": "H",
-    "H": "His",
-    "Ile": "I",
-    "I": "Ile",
-    "Leu": "L",
-    "L": "Leu",
-    "Lys": "K",
-    "K": "Lys",
-    "Met": "M",
-    "M": "Met",
-    "Phe": "F",
-    "F": "Phe",
-    "Pro": "P",
-    "P": "Pro",
-    "Ser": "S",
-    "S": "Ser",
-    "Thr": "T",
-    "T": "Thr",
-    "Trp": "W",
-    "W": "Trp",
-    "Tyr": "Y",
-    "Y": "Tyr",
-    "Val": "V",
-    "V": "Val",
-    "Ter": "*",
-    "*": "Ter",
-    "???": "?",
-    "?": "???",
-}
+CODON_TABLE = MappingProxyType(
+    {
+        "TTT": "F",
+        "TCT": "S",
+        "TAT": "Y",
+        "TGT": "C",
+        "TTC": "F",
+        "TCC": "S",
+        "TAC": "Y",
+        "TGC": "C",
+        "TTA": "L",
+        "TCA": "S",
+        "TAA": "*",
+        "TGA": "*",
+        "TTG": "L",
+        "TCG": "S",
+        "TAG": "*",
+        "TGG": "W",
+        "CTT": "L",
+        "CCT": "P",
+        "CAT": "H",
+        "CGT": "R",
+        "CTC": "L",
+        "CCC": "P",
+        "CAC": "H",
+        "CGC": "R",
+        "CTA": "L",
+        "CCA": "P",
+        "CAA": "Q",
+        "CGA": "R",
+        "CTG": "L",
+        "CCG": "P",
+        "CAG": "Q",
+        "CGG": "R",
+        "ATT": "I",
+        "ACT": "T",
+        "AAT": "N",
+        "AGT": "S",
+        "ATC": "I",
+        "ACC": "T",
+        "AAC": "N",
+        "AGC": "S",
+        "ATA": "I",
+        "ACA": "T",
+        "AAA": "K",
+        "AGA": "R",
+        "ATG": "M",
+        "ACG": "T",
+        "AAG": "K",
+        "AGG": "R",
+        "GTT": "V",
+        "GCT": "A",
+        "GAT": "D",
+        "GGT": "G",
+        "GTC": "V",
+        "GCC": "A",
+        "GAC": "D",
+        "GGC": "G",
+        "GTA": "V",
+        "GCA": "A",
+        "GAA": "E",
+        "GGA": "G",
+        "GTG": "V",
+        "GCG": "A",
+        "GAG": "E",
+        "GGG": "G",
+    }
+)
+
+
+#: Lookup table from ASCII byte value to the radix-4 digit of a nucleotide.
+#: Bytes that are not ``ACGT`` map to 4, which marks the codon as invalid.
+NT_RADIX = np.full(256, 4, dtype=np.uint8)
+for _i, _nt in enumerate("ACGT"):
+    NT_RADIX[ord(_nt)] = _i
+
+
+#: Codon table indexed by ``16 * n1 + 4 * n2 + n3`` using the digits in
+#: :py:const:`NT_RADIX`. The final entry (index 64) holds ``"?"`` for codons
+#: containing anything other than ``ACGT``.
+CODON_LUT = np.full(65, b"?", dtype="S1")
+for _codon, _aa in CODON_TABLE.items():
+    _d = NT_RADIX[[ord(_nt) for _nt in _codon]]
+    CODON_LUT[16 * _d[0] + 4 * _d[1] + _d[2]] = _aa
+del _i, _nt, _codon, _aa, _d
+
+
+#: Conversion from three-letter to single-letter amino acid codes
+AA3_TO_1 = MappingProxyType(
+    {
+        "Ala": "A",
+        "Arg": "R",
+        "Asn": "N",
+        "Asp": "D",
+        "Cys": "C",
+        "Glu": "E",
+        "Gln": "Q",
+        "Gly": "G",
+        "His": "H",
+        "Ile": "I",
+        "Leu": "L",
+        "Lys": "K",
+        "Met": "M",
+        "Phe": "F",
+        "Pro": "P",
+        "Ser": "S",
+        "Thr": "T",
+        "Trp": "W",
+        "Tyr": "Y",
+        "Val": "V",
+        "Ter": "*",
+        "???": "?",
+    }
+)
+
+
+#: Conversion from single-letter to three-letter amino acid codes
+AA1_TO_3 = MappingProxyType(
+    {
+        "A": "Ala",
+        "R": "Arg",
+        "N": "Asn",
+        "D": "Asp",
+        "C": "Cys",
+        "E": "Glu",
+        "Q": "Gln",
+        "G": "Gly",
+        "H": "His",
+        "I": "Ile",
+        "L": "Leu",
+        "K": "Lys",
+        "M": "Met",
+        "F": "Phe",
+        "P": "Pro",
+        "S": "Ser",
+        "T": "Thr",
+        "W": "Trp",
+        "Y": "Tyr",
+        "V": "Val",
+        "*": "Ter",
+        "?": "???",
+    }
+)
+
+
+#: Conversions between single- and three-letter amino acid codes in both
+#: directions. Kept for backwards compatibility, use :py:const:`AA3_TO_1` or
+#: :py:const:`AA1_TO_3` instead.
+AA_CODES = MappingProxyType({**AA3_TO_1, **AA1_TO_3})
 
 
 #: List of amino acids in row order for sequence-function maps.
-AA_LIST = [
+AA_LIST = (
     "H",
     "K",
     "R",  # (+)
@@ -205,37 +261,39 @@ AA_LIST = [
     "W",
     "Y",  # Aromatic
     "*",
-]
+)
 
 
 #: List of tuples for amino acid physiochemical property groups.
 #: Each tuple contains the label string and the corresponding start and end
 #: indices in :py:const:`aa_list` (inclusive).
-AA_LABEL_GROUPS = [
+AA_LABEL_GROUPS = (
     ("(+)", 0, 2),
     ("(-)", 3, 4),
     ("Polar-neutral", 5, 10),
     ("Non-polar", 11, 16),
     ("Aromatic", 17, 19),
-]
+)
 
 
 #: List of nucleotides in row order for sequence-function maps.
-NT_LIST = ["A", "C", "G", "T"]
+NT_LIST = ("A", "C", "G", "T")
 
 
 #: Dictionary specifying available scoring methods for the analysis
 #: Key is the internal name of the method, value is the GUI label
 #: For command line options, internal name is used for the option string itself
 #: and the value is the help string
-SCORING_METHODS = collections.OrderedDict(
-    [
-        ("WLS", "weighted least squares"),
-        ("ratios", "log ratios (Enrich2)"),
-        ("counts", "counts only"),
-        ("OLS", "ordinary least squares"),
-        ("simple", "log ratios (old Enrich)"),
-    ]
+SCORING_METHODS = MappingProxyType(
+    collections.OrderedDict(
+        [
+            ("WLS", "weighted least squares"),
+            ("ratios", "log ratios (Enrich2)"),
+            ("counts", "counts only"),
+            ("OLS", "ordinary least squares"),
+            ("simple", "log ratios (old Enrich)"),
+        ]
+    )
 )
 
 
@@ -243,18 +301,24 @@ SCORING_METHODS = collections.OrderedDict(
 #: Key is the internal name of the method, value is the GUI label
 #: For command line options, internal name is used for the option string itself
 #: and the value is the help string
-LOGR_METHODS = collections.OrderedDict(
-    [
-        ("wt", "wild type"),
-        ("complete", "library size (complete cases)"),
-        ("full", "library size (all reads)"),
-    ]
+LOGR_METHODS = MappingProxyType(
+    collections.OrderedDict(
+        [
+            ("wt", "wild type"),
+            ("complete", "library size (complete cases)"),
+            ("full", "library size (all reads)"),
+        ]
+    )
 )
 
 
 #: List specifying valid labels in their sorted order
 #: Sorted order is the order in which they should be calculated in
-ELEMENT_LABELS = ["barcodes", "identifiers", "variants", "synonymous"]
+ELEMENT_LABELS = ("barcodes", "identifiers", "variants", "synonymous")
+
+
+#: Position of each label in :py:const:`ELEMENT_LABELS`, used as a sort key
+ELEMENT_LABELS_INDEX = MappingProxyType({l: i for i, l in enumerate(ELEMENT_LABELS)})
 
 
 #: Default number of maximum mutation.
@@ -9,14 +9,16 @@ various ways.
 
 
 import collections
+import functools
 import logging
+from types import MappingProxyType
 
 import numpy as np
 import pandas as pd
 
 from ..base.utils import log_message
 from ..base.constants import ELEMENT_LABELS
-from ..base.constants import AA_CODES, AA_LIST, NT_LIST
+from ..base.constants import AA3_TO_1, AA_LIST, NT_LIST
 from ..base.constants import WILD_TYPE_VARIANT
 from ..libraries.barcodemap import re_barcode, re_identifier
 from ..libraries.variant import mutation_count
@@ -36,9 +38,15 @@ __all__ = [
 SingleMut = collections.namedtuple("SingleMut", ["pre", "post", "pos", "key"])
 
 
+#: Precompiled HGVS expressions keyed by the prefix that identifies them
+_HGVS_EXPRESSIONS = MappingProxyType(
+    {"n.": re_noncoding, "c.": re_coding, "p.": re_protein}
+)
+
+
 def validate_index(index, element):
     """
-    Return a boolean list for which index values are valid for the given
+    Return a boolean array for which index values are valid for the given
     element type.
     
     Parameters
@@ -50,24 +58,55 @@ def validate_index(index, element):
         
     Returns
     -------
-    list
-        List of booleans for which index values are valid for the given
+    :py:class:`np.ndarray`
+        Boolean array for which index values are valid for the given
         element type.
     """
-    if element not in ELEMENT_LABELS:
-        raise ValueError("Invalid element label '{}'".format(element))
-
-    if element == "barcodes":
-        retval = [re_barcode.match(x) is not None for x in index]
-    elif element == "identifiers":
-        retval = [re_identifier.match(x) is not None for x in index]
-    elif element == "variants":
-        retval = [True for _ in index]
-    elif element == "synonymous":
-        retval = [True for _ in index]
-    else:
+    validator = _INDEX_VALIDATORS.get(element)
+    if validator is None:
+        if element not in ELEMENT_LABELS:
+            raise ValueError("Invalid element label '{}'".format(element))
         raise NotImplementedError("Unimplemented element type '{}'" "".format(element))
-    return retval
+    return validator(index)
+
+
+def _match_index(index, pattern):
+    """
+    Match every value in *index* against the precompiled *pattern* using
+    pandas' vectorized string methods.
+
+    Parameters
+    ----------
+    index : `pd.Index`
+        Index of strings to match.
+    pattern : :py:class:`re.Pattern`
+        Compiled regular expression.
+
+    Returns
+    -------
+    :py:class:`np.ndarray`
+        Boolean array, ``True`` where the value matches *pattern*.
+    """
+    matches = pd.Series(index, dtype="object").str.match(pattern)
+    return matches.fillna(False).to_numpy(dtype=bool)
+
+
+def _all_valid(index):
+    """
+    Return a boolean array marking every value in *index* as valid.
+    """
+    return np.ones(len(index), dtype=bool)
+
+
+#: Index validation functions keyed by element label
+_INDEX_VALIDATORS = MappingProxyType(
+    {
+        "barcodes": functools.partial(_match_index, pattern=re_barcode),
+        "identifiers": functools.partial(_match_index, pattern=re_identifier),
+        "variants": _all_valid,
+        "synonymous": _all_valid,
+    }
+)
 
 
 def single_mutation_index(index):
@@ -108,6 +147,15 @@ def filter_coding_index(index):
     return pd.Index(x for x in index if "???" not in x)
 
 
+def _valid_singleton(x):
+    """
+    Return ``True`` if *x* is a single mutation without unrecognized amino
+    acids. Equivalent to applying :py:func:`single_mutation_index` and
+    :py:func:`filter_coding_index` to a single index value.
+    """
+    return mutation_count(x) == 1 and "???" not in x
+
+
 def single_mutations_to_tuples(index):
     """
     Return a list of SingleMut namedtuples for each single mutation in the
@@ -145,32 +193,51 @@ def single_mutations_to_tuples(index):
 
     # identify the type of index
     try:
-        if re_noncoding.match(index[0]):
-            is_protein = False
-            expression = re_noncoding
-        elif re_coding.match(index[0]):
-            is_protein = False
-            expression = re_coding
-        elif re_protein.match(index[0]):
-            is_protein = True
-            expression = re_protein
-        else:
-            raise ValueError("Unrecognized HGVS string.")
+        first = index[0]
     except IndexError:
         raise IndexError("Cannot convert empty index to tuples.")
+    prefix = first[:2]
+    expression = _HGVS_EXPRESSIONS.get(prefix)
+    if expression is None or not expression.match(first):
+        raise ValueError("Unrecognized HGVS string.")
+    is_protein = prefix == "p."
+
+    return list(_parse_mutations(tuple(index), expression, is_protein))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_mutations(keys, expression, is_protein):
+    """
+    Parse each HGVS string in *keys* with *expression* into a SingleMut
+    tuple. Results are cached so that repeated conversions of the same index
+    skip the regular expression matching.
 
+    Parameters
+    ----------
+    keys : `tuple`
+        The index values to parse.
+    expression : :py:class:`re.Pattern`
+        Compiled HGVS expression used to parse every value.
+    is_protein : `bool`
+        ``True`` if amino acids should be converted to single-letter codes.
+
+    Returns
+    -------
+    `tuple`
+        SingleMut namedtuples in the same order as *keys*.
+    """
     # perform the regular expression matches and create the SingleMut tuples
+    matches = list(map(expression.match, keys))
     tuples = list()
-    for x in index:
-        m = expression.match(x)
+    for x, m in zip(keys, matches):
         if m is None:
             raise ValueError("Unrecognized HGVS string {}.".format(x))
         else:
             if is_protein:  # convert to single-letter amino acid code
                 tuples.append(
                     SingleMut(
-                        AA_CODES[m.group("pre")],
-                        AA_CODES[m.group("post")],
+                        AA3_TO_1[m.group("pre")],
+                        AA3_TO_1[m.group("post")],
                         int(m.group("pos")),
                         m.group("match"),
                     )
@@ -185,7 +252,7 @@ def single_mutations_to_tuples(index):
                     )
                 )
 
-    return tuples
+    return tuple(tuples)
 
 
 def fill_position_gaps(positions, gap_size):
@@ -209,23 +276,27 @@ def fill_position_gaps(positions, gap_size):
         raise ValueError("Empty positions list.")
     if gap_size <= 0:
         raise ValueError("Gap size must be a positive integer.")
-    if not all(isinstance(p, int) for p in positions):
-        raise TypeError("Position elements must be integers.")
     if not isinstance(gap_size, int):
         raise TypeError("Gap size must be an integer.")
 
+    # checking the dtype of the converted array avoids a Python-level scan
+    positions = np.asarray(positions)
+    if positions.dtype.kind not in "iu":
+        raise TypeError("Position elements must be integers.")
+
     # uniqify and sort
-    positions = sorted(list(set(positions)))
+    positions = np.unique(positions.astype(np.int64, copy=False))
 
-    # fill in short gaps
-    fill = set()
-    for i in range(len(positions) - 1):
-        delta = positions[i + 1] - positions[i]
-        if delta > 1 and delta <= gap_size:
-            fill.update(positions[i] + n + 1 for n in range(delta))
-    fill.update(positions)
+    # fill in short gaps by expanding each position into the run of positions
+    # up to the next one when the gap is short enough
+    delta = np.diff(positions)
+    run_lengths = np.ones(len(positions), dtype=np.int64)
+    run_lengths[:-1] = np.where((delta > 1) & (delta <= gap_size), delta, 1)
+    run_starts = np.cumsum(run_lengths) - run_lengths
+    offsets = np.arange(run_lengths.sum()) - np.repeat(run_starts, run_lengths)
+    fill = np.repeat(positions, run_lengths) + offsets
 
-    return sorted(list(fill))
+    return fill.tolist()
 
 
 def singleton_dataframe(
@@ -269,10 +340,10 @@ def singleton_dataframe(
         raise ValueError(
             "Cannot process an empty data frame [{}]".format(wt.parent_name)
         )
-    if any(isinstance(v, str) for v in values) or any(
-        isinstance(v, bytes) for v in values
-    ):
-        raise ValueError("Values must be numbers.")
+    # only object columns can hold strings, so numeric dtypes skip the scan
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        if values.map(lambda v: isinstance(v, (str, bytes))).any():
+            raise ValueError("Values must be numbers.")
 
     # save the wild type score for later
     if plot_wt_score:
@@ -287,7 +358,12 @@ def singleton_dataframe(
             wt_score = np.nan
 
     # select only rows with singleton mutations
-    values = values[filter_coding_index(single_mutation_index(values.index))]
+    mask = np.fromiter(
+        (_valid_singleton(x) for x in values.index),
+        dtype=bool,
+        count=len(values.index),
+    )
+    values = values[mask]
     if len(values.index) == 0:
         raise ValueError("No valid singleton mutations exist in values.")
 
@@ -302,31 +378,38 @@ def singleton_dataframe(
         columns = aa_list
     else:
         columns = NT_LIST
-    frame = pd.DataFrame(np.nan, columns=columns, index=positions)
-    # populate the DataFrame
-    for x in index_tuples:
-        frame.loc[x.pos, x.post] = values.loc[x.key]
+    data = np.full((len(positions), len(columns)), np.nan, dtype=np.float64)
+    # populate the DataFrame with a single positional write
+    pos_to_row = {p: i for i, p in enumerate(positions)}
+    col_to_idx = {c: i for i, c in enumerate(columns)}
+    rows = np.array([pos_to_row[x.pos] for x in index_tuples], dtype=np.intp)
+    cols = np.array([col_to_idx[x.post] for x in index_tuples], dtype=np.intp)
+    value_map = dict(zip(values.index, values.to_numpy()))
+    data[rows, cols] = np.fromiter(
+        (value_map[x.key] for x in index_tuples),
+        dtype=np.float64,
+        count=len(index_tuples),
+    )
 
     # create a dictionary of position->nucleotide/amino acid
     wt_dict = dict(wt.position_tuples(protein=coding))
 
     # convert subset of the wild type dictionary into sequence
     try:
-        wt_sequence = "".join(wt_dict[x] for x in positions)
+        wt_chars = [wt_dict[x] for x in positions]
     except KeyError:
         raise ValueError("Inconsistent wild type positions [{}]".format(wt.parent_name))
+    wt_sequence = "".join(wt_chars)
 
     # double-check that the wild type is consistent with the data frame
-    for x in index_tuples:
-        if x.pos in wt_dict:
-            if x.pre != wt_dict[x.pos]:
-                raise ValueError(
-                    "Inconsistent wild type sequence [{}]".format(wt.parent_name)
-                )
+    pre = np.array([x.pre for x in index_tuples])
+    if np.any(np.array(wt_chars)[rows] != pre):
+        raise ValueError("Inconsistent wild type sequence [{}]".format(wt.parent_name))
 
     # add wild type scores if desired
     if plot_wt_score:
-        for p in positions:
-            frame.loc[p, wt_dict[p]] = wt_score
+        wt_cols = np.array([col_to_idx[c] for c in wt_chars], dtype=np.intp)
+        data[np.arange(len(positions)), wt_cols] = wt_score
 
+    frame = pd.DataFrame(data, index=pd.Index(positions), columns=columns, copy=False)
     return frame, wt_sequence
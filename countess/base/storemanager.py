@@ -7,24 +7,36 @@ Contains the abstract data-containing class StoreManager
 
 
 import os
+import json
 import time
+import hashlib
 import getpass
-import collections
+import numpy as np
 import pandas as pd
 
-from .utils import nested_format
-from ..base.utils import fix_filename
+import logging
+
+from .utils import compute_file_hash, compute_file_hashes
+from .utils import fix_filename, log_message, nested_format
 from .config_constants import SCORER, SCORER_PATH
-from ..base.constants import ELEMENT_LABELS
+from .constants import ELEMENT_LABELS, ELEMENT_LABELS_INDEX
+from .constants import HDF5_APPEND_BYTES, HDF5_CHUNK_BYTES
+from ..config.types import StoreConfiguration
 from countess.store.hdf import HdfStore
 
-import logging
-from ..base.utils import log_message
-
 
 __all__ = ["StoreManager"]
 
 
+def _index_length(index):
+    """
+    Returns the length of the longest value in *index* as a string, or 0 if
+    it is empty.
+    """
+    index = np.asarray(index, dtype=str)
+    return int(np.char.str_len(index).max()) if len(index) > 0 else 0
+
+
 class StoreManager(object):
     """
     Abstract class for all data-containing classes
@@ -40,6 +52,12 @@ class StoreManager(object):
         Indicates if the object is currently managing a store.
     treeview_class_name : str
         Class name used by the GUI treeview to render a readable name.
+    compression : bool
+        Indicates if tables written to the store are compressed.
+    compression_lib : str
+        Compression library used for the store if ``compression`` is set.
+    compression_level : int
+        Compression level used for the store if ``compression`` is set.
     
     Attributes
     ----------
@@ -62,8 +80,8 @@ class StoreManager(object):
     store : :py:class:`enrich2.base.store_interface.HDFStore`
         The store being managed by this instance.
     chunksize: int
-        Chunksize used when iterating and selecting rows/columns from an
-        open store.
+        Default chunksize used when iterating and selecting rows/columns from
+        an open store. See ``table_chunksize``.
     
     scorer_class : :py:class:`enrich2.plugins.scoring.BaseScorerPlugin`
         The class that has been loaded from a plugin script.
@@ -136,6 +154,14 @@ class StoreManager(object):
         Opens the currently owned store.
     store_close
         Closes the currently owned store.
+    input_files
+        Returns the input files hashed in the serialized configuration.
+    file_hash
+        Returns the hash of an input file for the serialized configuration.
+    check_store_metadata
+        Checks the metadata of every table in a store against this instance.
+    metadata_hash
+        Returns a hash of the serialized configuration of this instance.
     get_metadata
         Returns the metadata of this instance.
     set_metadata
@@ -149,10 +175,18 @@ class StoreManager(object):
         Write a specific table to tsv.
     get_table
         Returns the table located a specific key from the current store.
+    get_index
+        Returns the index of the table located at a specific key.
     check_store
         Checks the current store for the existence of a table with some key.
     map_table
         Maps a table by applying a callback function to a new table.
+    table_chunksize
+        Returns the number of rows per chunk for a table in the store.
+    max_index_length
+        Returns the length of the longest index value of a table.
+    compression_options
+        Returns the compression arguments used for the store.
     combined_index
         Return an index containing all elements in a list of tables.
     get_root
@@ -169,11 +203,22 @@ class StoreManager(object):
     store_suffix = None
     has_store = True
     treeview_class_name = None
+    compression = True
+    compression_lib = "blosc:lz4"
+    compression_level = 5
+
+    # incremented whenever any parent changes to invalidate cached roots
+    _tree_version = 0
+    # incremented whenever any name changes to invalidate cached orderings
+    _name_version = 0
 
     def __init__(self):
         # general data members
         self._name = None
+        self._fixed_name = None
         self.name = "Unnamed" + self.__class__.__name__
+        self._root = None
+        self._root_version = None
         self.parent = None
         self._labels = list()
 
@@ -186,6 +231,8 @@ class StoreManager(object):
         self.store_path = None
         self.store = None
         self.chunksize = 100000
+        # input file digests shared by one store_open or store_close call
+        self._file_hashes = None
 
         # output locations
         self._output_dir = None
@@ -210,6 +257,26 @@ class StoreManager(object):
     # -----------------------------------------------------------------------#
     #                           Properties
     # -----------------------------------------------------------------------#
+    @property
+    def name(self):
+        """
+        Name of the object, usually set through a configuration file or
+        the GUI.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Set the name and cache its filename-safe form.
+        """
+        self._name = value
+        StoreManager._name_version += 1
+        if isinstance(value, str):
+            self._fixed_name = fix_filename(value)
+        else:
+            self._fixed_name = None
+
     @property
     def labels(self):
         """
@@ -226,6 +293,20 @@ class StoreManager(object):
             else:
                 return self._labels
 
+    @property
+    def parent(self):
+        """
+        The parent :py:class:`StoreManager` of this instance, or ``None``.
+
+        Setting the parent invalidates the cached roots of all objects.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value):
+        self._parent = value
+        StoreManager._tree_version += 1
+
     @property
     def force_recalculate(self):
         """
@@ -234,16 +315,13 @@ class StoreManager(object):
 
         Recursively traverses up the config tree to find the root element.
         """
-        if self._force_recalculate is None:
-            if self.parent is not None:
-                return self.parent.force_recalculate
-            else:
-                raise ValueError(
-                    "Forced recalculation option not specified "
-                    "at root [{}]".format(self.name)
-                )
-        else:
-            return self._force_recalculate
+        value = self._inherited("_force_recalculate")
+        if value is None:
+            raise ValueError(
+                "Forced recalculation option not specified "
+                "at root [{}]".format(self.get_root().name)
+            )
+        return value
 
     @force_recalculate.setter
     def force_recalculate(self, value):
@@ -266,16 +344,13 @@ class StoreManager(object):
 
         Recursively traverses up the config tree to find the root element.
         """
-        if self._component_outliers is None:
-            if self.parent is not None:
-                return self.parent.component_outliers
-            else:
-                raise ValueError(
-                    "Calculate component outliers option not "
-                    "specified at root [{}]".format(self.name)
-                )
-        else:
-            return self._component_outliers
+        value = self._inherited("_component_outliers")
+        if value is None:
+            raise ValueError(
+                "Calculate component outliers option not "
+                "specified at root [{}]".format(self.get_root().name)
+            )
+        return value
 
     @component_outliers.setter
     def component_outliers(self, value):
@@ -298,15 +373,13 @@ class StoreManager(object):
 
         Recursively traverses up the config tree to find the root element.
         """
-        if self._tsv_requested is None:
-            if self.parent is not None:
-                return self.parent.tsv_requested
-            else:
-                raise ValueError(
-                    "Write tsv option not specified at root " "[{}]".format(self.name)
-                )
-        else:
-            return self._tsv_requested
+        value = self._inherited("_tsv_requested")
+        if value is None:
+            raise ValueError(
+                "Write tsv option not specified at root "
+                "[{}]".format(self.get_root().name)
+            )
+        return value
 
     @tsv_requested.setter
     def tsv_requested(self, value):
@@ -346,16 +419,13 @@ class StoreManager(object):
         no value set in the confic object) will automatically use the output
         directory from the parent.
         """
-        if self._output_dir is None:
-            if self.parent is not None:
-                return self.parent.output_dir
-            else:
-                raise ValueError(
-                    "No output directory specified at top level "
-                    "[{}]".format(self.name)
-                )
-        else:
-            return self._output_dir
+        value = self._inherited("_output_dir")
+        if value is None:
+            raise ValueError(
+                "No output directory specified at top level "
+                "[{}]".format(self.get_root().name)
+            )
+        return value
 
     @output_dir.setter
     def output_dir(self, dirname):
@@ -368,8 +438,7 @@ class StoreManager(object):
         except AttributeError as e:
             raise AttributeError("Invalid input for output directory: " "{}".format(e))
         try:
-            if not os.path.exists(dirname):
-                os.makedirs(dirname)
+            os.makedirs(dirname, exist_ok=True)
         except OSError as e:
             raise OSError("Failed to create output directory: {}".format(e))
         self._output_dir = dirname
@@ -382,16 +451,13 @@ class StoreManager(object):
 
         Recursively traverses up the config tree to find the root element.
         """
-        if self._output_dir_override is None:
-            if self.parent is not None:
-                return self.parent.output_dir_override
-            else:
-                raise ValueError(
-                    "Output directory override not specified at "
-                    "root [{}]".format(self.name)
-                )
-        else:
-            return self._output_dir_override
+        value = self._inherited("_output_dir_override")
+        if value is None:
+            raise ValueError(
+                "Output directory override not specified at "
+                "root [{}]".format(self.get_root().name)
+            )
+        return value
 
     @output_dir_override.setter
     def output_dir_override(self, value):
@@ -417,11 +483,10 @@ class StoreManager(object):
             dirname = os.path.join(
                 self.output_dir,
                 "tsv",
-                "{}_{}".format(fix_filename(self.name), self.store_suffix),
+                f"{self._fixed_name}_{self.store_suffix}",
             )
             try:
-                if not os.path.exists(dirname):
-                    os.makedirs(dirname)
+                os.makedirs(dirname, exist_ok=True)
             except OSError as e:
                 raise OSError("Failed to create tsv directory: {}".format(e))
             self._tsv_dir = dirname
@@ -450,12 +515,14 @@ class StoreManager(object):
         list
             list of labels shared by every child.
         """
-        shared = list()
-        for x in self.children:
-            shared.extend(x.labels)
-        shared = collections.Counter(shared)
-        shared = [x for x in shared.keys() if shared[x] == len(self.children)]
-        return sorted(shared, key=lambda a: ELEMENT_LABELS.index(a))
+        children = iter(self.children)
+        try:
+            shared = set(next(children).labels)
+        except StopIteration:
+            return list()
+        for x in children:
+            shared.intersection_update(x.labels)
+        return sorted(shared, key=ELEMENT_LABELS_INDEX.__getitem__)
 
     def _children(self):
         """
@@ -495,16 +562,63 @@ class StoreManager(object):
     def get_root(self):
         """
         Returns the root owner of this object, other self if this object
-        has no parents.
+        has no parents. The root is cached until any parent changes.
 
         Returns
         -------
         :py:class:`StoreManager`
         """
-        if self.parent is not None:
-            return self.parent.get_root()
-        else:
-            return self
+        if self._root is None or self._root_version != StoreManager._tree_version:
+            node = self
+            while node.parent is not None:
+                node = node.parent
+            self._root = node
+            self._root_version = StoreManager._tree_version
+        return self._root
+
+    def _walk_stores(self):
+        """
+        Returns this object and all of its descendants in an order where
+        every object comes after its own descendants. Uses an explicit stack
+        instead of recursion.
+
+        Returns
+        -------
+        `list`
+            List of :py:class:`StoreManager` objects.
+        """
+        order = list()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if node.children is not None:
+                stack.extend(node.children)
+        order.reverse()
+        return order
+
+    def _inherited(self, attr):
+        """
+        Returns the value of the private attribute *attr* from the closest
+        object, starting with this one and moving up the tree, for which it
+        is not ``None``. Returns ``None`` if no object has it set.
+
+        Parameters
+        ----------
+        attr : `str`
+            Name of the attribute
+
+        Returns
+        -------
+        The attribute value or ``None``.
+        """
+        node = self
+        while node is not None:
+            value = getattr(node, attr)
+            if value is not None:
+                return value
+            node = node.parent
+        return None
 
     # -----------------------------------------------------------------------#
     #                       Class Configuration
@@ -525,8 +639,6 @@ class StoreManager(object):
         raises TypeError if ``cfg`` is not a :py:class:`dict` or
             :py:class:`enrich2.config.types.StoreConfiguration`
         """
-        from ..config.types import StoreConfiguration
-
         if isinstance(cfg, dict):
             has_scorer = bool(cfg.get(SCORER, {}).get(SCORER_PATH, ""))
             cfg = StoreConfiguration(cfg, has_scorer=has_scorer)
@@ -550,7 +662,8 @@ class StoreManager(object):
             self.store_path = cfg.store_path
             log_message(
                 logging_callback=logging.info,
-                msg='Using specified HDF5 data store "{}"'.format(self.store_path),
+                msg='Using specified HDF5 data store "%s"',
+                args=(self.store_path,),
                 extra={"oname": self.name},
             )
         else:
@@ -626,77 +739,140 @@ class StoreManager(object):
         force_delete : `bool`
             Delete existing tables under ``'/main'`` upon store opening.
         """
-        if children and self.children is not None:
-            for child in self.children:
-                child.store_open(children=True)
+        nodes = self._walk_stores() if children else [self]
+
+        # the configuration of every store is serialized to check its
+        # metadata, so hash all input files up front in parallel
+        root = self.get_root()
+        root._file_hashes = compute_file_hashes(
+            f for node in nodes for f in node.input_files()
+        )
+        try:
+            for node in nodes:
+                if node is not self:
+                    node._open_own_store(force_delete=False)
+            self._open_own_store(force_delete)
+        finally:
+            root._file_hashes = None
 
+    def file_hash(self, fname):
+        """
+        Returns the hash of the file at *fname* for a serialized
+        configuration. Digests computed at the start of the current
+        :py:meth:`store_open` or :py:meth:`store_close` call are reused;
+        otherwise the file is hashed.
+
+        Parameters
+        ----------
+        fname : `str`
+            Path to file.
+
+        Returns
+        -------
+        `str`
+            Hexadecimal digest of the hashed file.
+        """
+        hashes = self.get_root()._file_hashes
+        if hashes is not None and fname in hashes:
+            return hashes[fname]
+        return compute_file_hash(fname)
+
+    def input_files(self):
+        """
+        Returns the paths of the input files whose hashes are stored in the
+        serialized configuration of this object. Subclasses with input files
+        extend this list.
+
+        Returns
+        -------
+        `list`
+            List of file paths.
+        """
+        if self.scorer_path is not None:
+            return [self.scorer_path]
+        return []
+
+    def _open_own_store(self, force_delete):
+        """
+        Open the HDF5 file associated with this object only. Used by
+        :py:meth:`store_open`.
+
+        Parameters
+        ----------
+        force_delete : `bool`
+            Delete existing tables under ``'/main'`` upon store opening.
+        """
         clear = False
         if self.has_store:
-            if self.store is not None and self.store.is_open():
+            if self.store is not None:
                 raise ValueError("Store is still open.")
 
             if not self.store_cfg:
-                fname = fix_filename(self.name)
                 self.store_path = os.path.join(
-                    self.output_dir, "{}_{}.h5".format(fname, self.store_suffix)
+                    self.output_dir, f"{self._fixed_name}_{self.store_suffix}.h5"
                 )
             log_message(
                 logging_callback=logging.info,
-                msg="Loading from store path '{}'.".format(self.store_path),
+                msg="Loading from store path '%s'.",
+                args=(self.store_path,),
                 extra={"oname": self.name},
             )
             if os.path.exists(self.store_path):
-                store = HdfStore(self.store_path, mode="a")
-                for key in store.keys():
-                    clear |= not self.check_metadata(key, store)
+                store = HdfStore(self.store_path)
+                clear = not self.check_store_metadata(store)
                 if clear:
-                    msg = (
-                        'Found existing HDF5 data store "{}", but '
-                        "metadata did not match with this "
-                        "instance.".format(self.store_path)
-                    )
                     log_message(
                         logging_callback=logging.info,
-                        msg=msg,
+                        msg='Found existing HDF5 data store "%s", but '
+                        "metadata did not match with this instance.",
+                        args=(self.store_path,),
                         extra={"oname": self.name},
                     )
-                    if not store.is_empty():
-                        try:
-                            store.clear()
-                        except ValueError:
-                            raise IOError(
-                                "Store '{}' currently has an open"
-                                "file handle not owned by Enrich2. "
-                                "Cannot overwrite existing "
-                                "data.".format(self.store_path)
-                            )
+                    try:
+                        for key in list(store.keys()):
+                            store.drop(key)
+                    except ValueError:
+                        raise IOError(
+                            "Store '{}' currently has an open "
+                            "file handle not owned by Enrich2. "
+                            "Cannot overwrite existing "
+                            "data.".format(self.store_path)
+                        )
                 else:
                     log_message(
                         logging_callback=logging.info,
-                        msg='Found existing HDF5 data store "{}" with matching'
-                        " metadata.".format(self.store_path),
+                        msg='Found existing HDF5 data store "%s" with matching'
+                        " metadata.",
+                        args=(self.store_path,),
                         extra={"oname": self.name},
                     )
                     self.override_filter_stats = False
-                store.close()
+                # The file hash is written back by a successful store_close,
+                # so a run that stops early leaves the tables to be checked.
+                store.set_file_metadata({})
 
             else:
                 log_message(
                     logging_callback=logging.info,
-                    msg='Creating new HDF5 data store "{}"'.format(self.store_path),
+                    msg='Creating new HDF5 data store "%s"',
+                    args=(self.store_path,),
                     extra={"oname": self.name},
                 )
 
-            self.store = HdfStore(self.store_path, mode="a")
+            self.store = HdfStore(self.store_path, **self.compression_options())
 
             if self.force_recalculate or force_delete:
-                if "/main" in self.store:
+                calculated = [
+                    k for k in self.store.keys() if k.lstrip("/").startswith("main/")
+                ]
+                if len(calculated) > 0:
                     log_message(
                         logging_callback=logging.info,
                         msg="Deleting existing calculated values",
                         extra={"oname": self.name},
                     )
-                    self.store.remove("/main")
+                    for key in calculated:
+                        self.store.drop(key)
                 else:
                     log_message(
                         logging_callback=logging.warning,
@@ -718,19 +894,37 @@ class StoreManager(object):
 
         """
         # needs more error checking
-        if children and self.children is not None:
-            for child in self.children:
-                child.store_close(children=True)
+        nodes = self._walk_stores() if children else [self]
 
-        if self.has_store and self.store is not None and self.store.is_open():
+        # every store serializes its configuration into its metadata
+        root = self.get_root()
+        root._file_hashes = compute_file_hashes(
+            f for node in nodes if node.store is not None for f in node.input_files()
+        )
+        try:
+            for node in nodes:
+                if node is not self:
+                    node._close_own_store()
+            self._close_own_store()
+        finally:
+            root._file_hashes = None
+
+    def _close_own_store(self):
+        """
+        Close the HDF5 file associated with this object only. Used by
+        :py:meth:`store_close`.
+        """
+        if self.has_store and self.store is not None:
             # Set the metadata. Resets if it already exists, but that should
             # be fine since if it already exists, then it should match.
+            metadata = self.metadata()
             for key in self.store.keys():
-                self.set_metadata(key, self.metadata(), update=False)
-            self.store.close()
+                self.set_metadata(key, metadata, update=False)
+            if not self.store.is_empty():
+                self.store.set_file_metadata({"cfg_hash": metadata["cfg_hash"]})
             self.store = None
 
-    def get_table(self, key):
+    def get_table(self, key, columns=None):
         """
         Checks to see if a particular data frame in the HDF5 store already
         exists and returns it.
@@ -739,16 +933,39 @@ class StoreManager(object):
         ----------
         key : `str`
             Key for the requested data frame
+        columns : `list`, optional, default None
+            Columns to read. If ``None``, read all columns. Reading only the
+            required columns avoids building the blocks of the others.
 
         Returns
         -------
-        :py:class:`~pandas.HDFStore` 
-            True if the key exists in the HDF5 store, else False.
+        :py:class:`~pandas.DataFrame`
+            The data frame stored under *key*.
         """
         if not self.check_store(key):
             raise ValueError("Store {} does not exist [{}]".format(key, self.name))
         else:
-            return self.store[key]
+            return self.store.select(key, columns=columns)
+
+    def get_index(self, key):
+        """
+        Return the index of the table under *key* without reading any of its
+        columns.
+
+        Parameters
+        ----------
+        key : `str`
+            Key for the requested data frame
+
+        Returns
+        -------
+        :py:class:`~pandas.Index`
+            The index of the data frame stored under *key*.
+        """
+        if not self.check_store(key):
+            raise ValueError("Store {} does not exist [{}]".format(key, self.name))
+        else:
+            return pd.Index(self.store.get_column(key, "index"), copy=False)
 
     def check_store(self, key):
         """
@@ -765,10 +982,11 @@ class StoreManager(object):
         `bool` 
             True if the key exists in the HDF5 store, else False.
         """
-        if key in list(self.store.keys()):
+        if key in self.store:
             log_message(
                 logging_callback=logging.info,
-                msg="Found existing '{}'".format(key),
+                msg="Found existing '%s'",
+                args=(key,),
                 extra={"oname": self.name},
             )
             return True
@@ -783,6 +1001,7 @@ class StoreManager(object):
         row_callback=None,
         row_callback_args=None,
         destination_data_columns=None,
+        column_callback=None,
     ):
         """
         Converts source table into destination table.
@@ -797,48 +1016,251 @@ class StoreManager(object):
         source_query : `str`
             A query string used as a predicate during mapping
         row_callback : `Callable`
-            Callback function applied to each row.
+            Callback function applied to each row. Ignored if
+            *column_callback* is given.
         row_callback_args : `Iterable`
-            Arguments required by *row_callback*
+            Arguments required by *row_callback* or *column_callback*
         destination_data_columns : `Iterable`
-            Iterable of column names
-        """
-        if destination in list(self.store.keys()):
+            Iterable of column names that can be used in queries on the
+            destination table. If ``None``, only the index can be queried,
+            which keeps appends fast for tables that are read whole.
+        column_callback : `Callable`
+            Callback function applied to each chunk as a whole. Takes the
+            chunk :py:class:`~pandas.DataFrame` followed by
+            *row_callback_args* and returns the mapped data frame. Preferred
+            over *row_callback* since it can operate on entire columns at
+            once instead of on one row at a time.
+        """
+        if destination in self.store:
             # remove the current destination table because we are using append
             # append takes the "min_itemsize" argument, and put doesn't
             log_message(
                 logging_callback=logging.info,
-                msg="Overwriting existing '{}'".format(destination),
+                msg="Overwriting existing '%s'",
+                args=(destination,),
                 extra={"oname": self.name},
             )
-            self.store.remove(destination)
+            self.store.drop(destination)
 
         # turn the single table name into a list to use select_as_multiple
         if isinstance(source, str):
             source = [source]
 
+        # look up the selector table once for all of its metadata
+        info = self.store.table_info(source[0], attrs=("max_index_len",))
+
         # assumes the source tables all have the same index
-        # find the min_itemsize
-        max_index_length = self.store.get_column(source[0], "index").map(len).max()
+        # find the min_itemsize, widened if the mapped index is longer
+        max_index_length = self.max_index_length(source[0], info=info)
+        # longest index value actually written to the destination
+        written_index_length = 0
+
+        # read and write about one HDF5 chunk worth of rows at a time
+        chunksize = self.table_chunksize(source[0], info=info)
+        expected_rows = info["nrows"]
 
-        selections = self.store.select_as_multiple(
-            keys=source, where=source_query, selector=source[0], chunk=True
+        selections = self._select_batches(
+            source, source_query, chunksize, expected_rows
         )
+        if row_callback_args is None:
+            row_callback_args = ()
+
+        # collect several chunks and append them together to reduce the
+        # number of appends to the destination table
+        batch_rows = self.table_chunksize(source[0], HDF5_APPEND_BYTES, info=info)
+        batch = list()
+        n_rows = 0
         for df in selections:
-            if row_callback is not None:
+            if column_callback is not None:
+                df = column_callback(df, *row_callback_args)
+            elif row_callback is not None:
                 df = df.apply(row_callback, args=row_callback_args, axis="columns")
-            if destination not in self.store:
-                if destination_data_columns is None:
-                    # if not specified, index all columns
-                    destination_data_columns = list(df.columns)
-                self.store.append(
+            batch.append(df)
+            n_rows += len(df)
+            if n_rows >= batch_rows:
+                length = self._append_mapped(
                     destination,
-                    df,
-                    min_itemsize={"index": max_index_length},
-                    data_columns=destination_data_columns,
+                    pd.concat(batch),
+                    max_index_length,
+                    destination_data_columns,
+                    chunksize,
+                    expected_rows,
                 )
-            else:
-                self.store.append(destination, df)
+                written_index_length = max(written_index_length, length)
+                batch = list()
+                n_rows = 0
+        if len(batch) > 0:
+            length = self._append_mapped(
+                destination,
+                pd.concat(batch),
+                max_index_length,
+                destination_data_columns,
+                chunksize,
+                expected_rows,
+            )
+            written_index_length = max(written_index_length, length)
+        if destination in self.store:
+            self.store.set_table_attr(
+                destination, "max_index_len", written_index_length
+            )
+
+    def _select_batches(self, source, source_query, chunksize, nrows):
+        """
+        Yields data frames of at most *chunksize* rows selected from the
+        tables in *source*.
+
+        The predicate *source_query* is resolved against the selector table
+        ``source[0]`` once, and the matching coordinates are then read in
+        fixed-size slices. Without a predicate, contiguous row ranges are
+        read instead so that no coordinate list has to be built.
+
+        Parameters
+        ----------
+        source : `list`
+            Keys of the tables to select from, selector table first
+        source_query : `str`
+            A query string used as a predicate, or ``None``
+        chunksize : `int`
+            Maximum number of rows per data frame
+        nrows : `int`
+            Number of rows in the selector table
+        """
+        if source_query is None:
+            for start in range(0, nrows, chunksize):
+                yield self.store.select_as_multiple(
+                    keys=source,
+                    selector=source[0],
+                    start=start,
+                    stop=min(start + chunksize, nrows),
+                )
+        else:
+            coords = self.store.select_as_coordinates(source[0], source_query)
+            for start in range(0, len(coords), chunksize):
+                yield self.store.select_as_multiple(
+                    keys=source,
+                    where=coords[start : start + chunksize],
+                    selector=source[0],
+                )
+
+    def _append_mapped(
+        self, destination, df, max_index_length, data_columns, chunksize, expected_rows
+    ):
+        """
+        Append a batch of mapped rows to the *destination* table, creating
+        the table on the first append. Used by :py:meth:`map_table`.
+        Returns the length of the longest index value in the batch.
+
+        Parameters
+        ----------
+        destination : `str`
+            The key to put the mapped rows
+        df : :py:class:`~pandas.DataFrame`
+            The mapped rows
+        max_index_length : `int`
+            Minimum item size of the index column. The column is made wider
+            if the first batch has longer index values.
+        data_columns : `Iterable`
+            Iterable of column names to index. If ``None``, no columns are
+            indexed.
+        chunksize : `int`
+            Number of rows written at a time
+        expected_rows : `int`
+            Expected number of rows in the destination table
+
+        Returns
+        -------
+        `int`
+            Length of the longest index value in *df*.
+        """
+        index_length = _index_length(df.index)
+        if destination not in self.store:
+            self.store.append(
+                destination,
+                df,
+                min_itemsize={"index": max(max_index_length, index_length)},
+                data_columns=data_columns,
+                chunksize=chunksize,
+                expectedrows=expected_rows,
+            )
+        else:
+            self.store.append(destination, df, chunksize=chunksize)
+        return index_length
+
+    def max_index_length(self, key, info=None):
+        """
+        Return the length of the longest index value of the table under
+        *key*.
+
+        Uses the ``max_index_len`` attribute stored with tables created by
+        :py:meth:`map_table` if present, otherwise measures the index.
+
+        Parameters
+        ----------
+        key : `str`
+            Key of the table in the store.
+        info : `dict`, optional, default None
+            The :py:meth:`~countess.store.hdf.HdfStore.table_info` of the
+            table under *key* including ``max_index_len``, if it has already
+            been looked up.
+
+        Returns
+        -------
+        `int`
+            Length of the longest index value.
+        """
+        if info is None:
+            info = self.store.table_info(key, attrs=("max_index_len",))
+        length = info["max_index_len"]
+        if length is None:
+            length = _index_length(self.store.get_column(key, "index"))
+        return length
+
+    def compression_options(self):
+        """
+        Return the compression keyword arguments used when opening the store.
+        Every table written to the store uses them.
+
+        Returns
+        -------
+        `dict`
+            Dictionary with ``complib`` and ``complevel`` entries.
+        """
+        if self.compression:
+            return {
+                "complib": self.compression_lib,
+                "complevel": self.compression_level,
+            }
+        else:
+            return {"complib": None, "complevel": 0}
+
+    def table_chunksize(self, key, target_bytes=HDF5_CHUNK_BYTES, info=None):
+        """
+        Return the number of rows of the table under *key* that fill about
+        *target_bytes* bytes. The default covers roughly one HDF5 chunk per
+        read or write.
+
+        Falls back to ``chunksize`` if the row size of the table is unknown.
+
+        Parameters
+        ----------
+        key : `str`
+            Key of the table in the store.
+        target_bytes : `int`
+            Number of bytes per chunk.
+        info : `dict`, optional, default None
+            The :py:meth:`~countess.store.hdf.HdfStore.table_info` of the
+            table under *key*, if it has already been looked up.
+
+        Returns
+        -------
+        `int`
+            Number of rows per chunk.
+        """
+        if info is None:
+            info = self.store.table_info(key)
+        if info["rowsize"] is None:
+            return self.chunksize
+        return max(1, target_bytes // info["rowsize"])
 
     def combined_index(self, tables):
         """
@@ -849,10 +1271,12 @@ class StoreManager(object):
         tables : `Iterable`
             Iterable object containing :py:class:`~pd.HDFStore` objects.
         """
-        shared = pd.Index()
-        for t in tables:
-            shared = shared.union(pd.Index(self.store.get_column(t, "index")))
-        return shared
+        columns = [np.asarray(self.store.get_column(t, "index")) for t in tables]
+        if len(columns) == 0:
+            return pd.Index([])
+        # a single sort and deduplication of all values instead of a
+        # pairwise union per table
+        return pd.Index(np.unique(np.concatenate(columns)), copy=False)
 
     # -----------------------------------------------------------------------#
     #                       Metadata/Computations
@@ -881,12 +1305,13 @@ class StoreManager(object):
         else:
             raise AttributeError("Failed to add labels [{}]".format(self.name))
         # sort based on specified order
-        self._labels = sorted(labels, key=lambda a: ELEMENT_LABELS.index(a))
+        self._labels = sorted(labels, key=ELEMENT_LABELS_INDEX.__getitem__)
 
     def metadata(self):
         """
         Creates the metadata `dict` which contains the configuration
-        for this store, along with creation time and creation user.
+        for this store and its hash, along with creation time and creation
+        user.
         
         Returns
         -------
@@ -894,7 +1319,12 @@ class StoreManager(object):
             Metadata dictionary.
         """
         cfg = self.serialize()
-        metadata = {"cfg": cfg, "time": self.creationtime, "user": self.username}
+        metadata = {
+            "cfg": cfg,
+            "cfg_hash": self.metadata_hash(cfg),
+            "time": self.creationtime,
+            "user": self.username,
+        }
         return metadata
 
     def check_metadata(self, key, store=None):
@@ -920,11 +1350,92 @@ class StoreManager(object):
 
         this = self.metadata()
         other = self.get_metadata(key, store)
-        this_cfg = this.get("cfg", {})
+        return self._cfg_matches(this["cfg"], this["cfg_hash"], other)
+
+    @staticmethod
+    def _cfg_matches(this_cfg, this_hash, other):
+        """
+        Compare a serialized configuration against the metadata of a table.
+
+        Metadata written by this version carries the hash of its
+        configuration, so a matching hash is accepted without walking both
+        configurations. Otherwise the configurations are compared in full.
+
+        Parameters
+        ----------
+        this_cfg : `dict`
+            Serialized configuration of this instance.
+        this_hash : `str`
+            Hash of *this_cfg* from :py:meth:`metadata_hash`.
+        other : `dict` or ``None``
+            Metadata of the table.
+
+        Returns
+        -------
+        `bool`
+            ``True`` if the configurations are equal.
+        """
         if other is None:
             return False
+        if other.get("cfg_hash") == this_hash:
+            return True
         other_cfg = other.get("cfg", {})
-        return this_cfg == other_cfg
+        return this_cfg is other_cfg or this_cfg == other_cfg
+
+    def check_store_metadata(self, store=None):
+        """
+        Check if the metadata of this instance matches the metadata of every
+        table in *store*.
+
+        The configuration of this instance is serialized once and the check
+        stops at the first table that does not match, instead of calling
+        :py:meth:`check_metadata` for every key. The file is opened once for
+        all tables. If the hash written to the file by :py:meth:`store_close`
+        matches, the tables are not read at all.
+
+        Parameters
+        ----------
+        store : :py:class:`~HdfStore`
+            The store object to check
+
+        Returns
+        -------
+        `bool`
+            ``True`` if the metadata of every table matches.
+        """
+        if store is None:
+            store = self.store
+
+        this = self.metadata()
+        cfg_hash = this["cfg_hash"]
+        if store.get_file_metadata().get("cfg_hash") == cfg_hash:
+            return True
+        for _, other in store.iter_metadata():
+            if not self._cfg_matches(this["cfg"], cfg_hash, other):
+                return False
+        return True
+
+    def metadata_hash(self, cfg=None):
+        """
+        Hash of the serialized configuration of this instance, used to
+        compare it against an existing store without reading the metadata of
+        each table.
+
+        Parameters
+        ----------
+        cfg : `dict`, optional, default None
+            The serialized configuration. If ``None``, use
+            :py:meth:`serialize`.
+
+        Returns
+        -------
+        `str`
+            Hexadecimal digest of the configuration.
+        """
+        if cfg is None:
+            cfg = self.serialize()
+        encoded = json.dumps(cfg, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
 
     def get_metadata(self, key, store=None):
         """
@@ -1010,6 +1521,6 @@ class StoreManager(object):
         """
         fname = key.strip("/")  # remove leading slash
         fname = fname.replace("/", "_") + ".tsv"
-        self.store[key].to_csv(
+        self.store.select(key).to_csv(
             os.path.join(str(self.tsv_dir), fname), sep="\t", na_rep="NA"
         )
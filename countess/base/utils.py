@@ -6,14 +6,21 @@ Contains various utility functions used through-out enrich2
 """
 
 
+import re
+import numpy as np
 import pandas as pd
-from queue import Queue
+from collections import deque
+from collections.abc import Iterable, Sized
+import io
 import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import traceback
 
-from ..base.constants import CALLBACK, MESSAGE, KWARGS
+from ..base.constants import CALLBACK, MESSAGE, ARGS, KWARGS
+from ..base.constants import CODON_LUT, NT_RADIX, LOG_QUEUE_MAXLEN
+from ..base.constants import FILE_HASH_ALGORITHM, HASH_BLOCK_BYTES
 
 
 __all__ = [
@@ -23,6 +30,9 @@ __all__ = [
     "infer_multiindex_header_rows",
     "is_number",
     "compute_md5",
+    "compute_file_hash",
+    "compute_file_hashes",
+    "translate_dna",
     "init_logging_queue",
     "get_logging_queue",
     "log_message",
@@ -32,13 +42,37 @@ __all__ = [
 LOG_QUEUE = None
 
 
+#: Maximum number of leading rows of a tsv file considered as header rows
+MAX_HEADER_ROWS = 16
+
+
+#: Characters other than decimal digits, whitespace and the first letters of
+#: ``inf`` and ``nan`` that can start a string accepted by :py:func:`float`
+_NUMBER_START = frozenset("+-.")
+
+
+#: Strings starting with a letter that are accepted by :py:func:`float`
+_NON_FINITE_START = frozenset("iInN")
+_NON_FINITE = re.compile(r"(?:inf(?:inity)?|nan)[^\S\x1c-\x1f]*", re.IGNORECASE)
+
+
+#: Characters removed by :py:func:`fix_filename`. ``\w`` matches exactly the
+#: characters for which :py:meth:`str.isalnum` is true, plus ``'_'``.
+_INVALID_FILENAME_CHARS = re.compile(r"[^\w .~]")
+
+
 def init_logging_queue():
     """
     Inits the logging queue if it is ``None``.
+
+    The queue is a :py:class:`~collections.deque` holding at most
+    ``LOG_QUEUE_MAXLEN`` messages. Appending and popping are atomic, so no
+    lock is taken when logging, and the oldest messages are dropped instead
+    of blocking the analysis if the queue is not drained.
     """
     global LOG_QUEUE
     if LOG_QUEUE is None:
-        LOG_QUEUE = Queue()
+        LOG_QUEUE = deque(maxlen=LOG_QUEUE_MAXLEN)
         log_message(
             logging.info,
             "Logging Queue has been initialized.",
@@ -57,14 +91,14 @@ def get_logging_queue(init=False):
     
     Returns
     -------
-    :py:class:`Queue`
+    :py:class:`~collections.deque`
     """
     if init:
         init_logging_queue()
     return LOG_QUEUE
 
 
-def log_message(logging_callback, msg, **kwargs):
+def log_message(logging_callback, msg, args=(), **kwargs):
     """
     Places a logging message into the active queue.
     
@@ -74,26 +108,33 @@ def log_message(logging_callback, msg, **kwargs):
         The logging function to use from the logging module.
     msg : `str` or `Exception`
         The message to log.
+    args : `tuple`
+        Arguments merged into *msg* with ``%`` formatting by the logging
+        module. Formatting is skipped if the message is filtered out.
     kwargs : `dict`
         Keyword arguments for logging module.
+
+    Notes
+    -----
+    If *msg* is an `Exception`, its traceback is also logged. The traceback
+    is only formatted if error messages are enabled on the root logger.
     """
-    log = {CALLBACK: logging_callback, MESSAGE: msg, KWARGS: kwargs}
+    log = {CALLBACK: logging_callback, MESSAGE: msg, ARGS: args, KWARGS: kwargs}
     queue = get_logging_queue(init=False)
     if queue is None:
-        logging_callback(msg, **kwargs)
-        if isinstance(msg, Exception):
-            tb = msg.__traceback__
-            logging.exception("".join(traceback.format_tb(tb)), **kwargs)
+        logging_callback(msg, *args, **kwargs)
     else:
-        queue.put(log)
-        if isinstance(msg, Exception):
-            tb = msg.__traceback__
-            error = {
-                CALLBACK: logging.exception,
-                MESSAGE: "".join(traceback.format_tb(tb)),
-                KWARGS: kwargs,
-            }
-            queue.put(error)
+        queue.append(log)
+
+    if isinstance(msg, Exception) and logging.getLogger().isEnabledFor(logging.ERROR):
+        buffer = io.StringIO()
+        traceback.print_tb(msg.__traceback__, file=buffer)
+        tb = buffer.getvalue()
+        if queue is None:
+            logging.exception(tb, **kwargs)
+        else:
+            error = {CALLBACK: logging.exception, MESSAGE: tb, ARGS: (), KWARGS: kwargs}
+            queue.append(error)
 
 
 def nested_format(data, default, tab_level=1):
@@ -114,47 +155,91 @@ def nested_format(data, default, tab_level=1):
     `str`
         A formatted string.
     """
-    msg = ""
-    if isinstance(data, list) or isinstance(data, tuple):
-        if not data:
-            msg += "Empty Iterable"
-        else:
-            msg += "-> Iterable"
-            if default:
-                msg += "-> Iterable [Default]"
-            try:
-                for i, (value, default) in enumerate(data):
-                    msg += "\n" + "\t" * tab_level + "@index {}: ".format(i)
-                    msg += nested_format(value, default, tab_level)
-            except (TypeError, ValueError):
-                for i, value in enumerate(data):
-                    msg += "\n" + "\t" * tab_level + "@index {}: ".format(i)
-                    msg += nested_format(value, False, tab_level)
-            msg += "\n" + "\t" * tab_level + "@end of list"
-    elif isinstance(data, dict):
-        if not data:
-            msg += "Empty Dictionary"
+    parts = []
+    # the stack holds strings to output as they are and (data, default,
+    # tab_level) tuples still to be formatted, so nesting does not recurse
+    stack = [(data, default, tab_level)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+
+        data, default, tab_level = item
+        indent = "\n" + "\t" * tab_level
+        if isinstance(data, list) or isinstance(data, tuple):
+            if not data:
+                parts.append("Empty Iterable")
+            else:
+                parts.append("-> Iterable")
+                if default:
+                    parts.append("-> Iterable [Default]")
+                labels = ["{}@index {}: ".format(indent, i) for i in range(len(data))]
+                children = _format_children(labels, data, tab_level)
+                children.append(indent + "@end of list")
+                stack.extend(reversed(children))
+        elif isinstance(data, dict):
+            if not data:
+                parts.append("Empty Dictionary")
+            else:
+                parts.append("-> Dictionary")
+                if default:
+                    parts.append("-> Dictionary [Default]")
+                labels = ["{}{}: ".format(indent, key) for key in data]
+                children = _format_children(labels, data.values(), tab_level + 1)
+                stack.extend(reversed(children))
         else:
-            msg += "-> Dictionary"
+            if isinstance(data, str):
+                data = "'{}'".format(data)
+            dtype = type(data).__name__
             if default:
-                msg += "-> Dictionary [Default]"
-            try:
-                for key, (value, default) in data.items():
-                    msg += "\n" + "\t" * tab_level + "{}: ".format(key)
-                    msg += nested_format(value, default, tab_level + 1)
-            except (TypeError, ValueError):
-                for key, value in data.items():
-                    msg += "\n" + "\t" * tab_level + "{}: ".format(key)
-                    msg += nested_format(value, False, tab_level + 1)
-    else:
-        if isinstance(data, str):
-            data = "'{}'".format(data)
-        dtype = type(data).__name__
-        if default:
-            msg += "({} [Default], {})".format(data, dtype)
-        else:
-            msg += "({}, {})".format(data, dtype)
-    return msg
+                parts.append("({} [Default], {})".format(data, dtype))
+            else:
+                parts.append("({}, {})".format(data, dtype))
+    return "".join(parts)
+
+
+def _format_children(labels, values, tab_level):
+    """
+    Returns the output of :py:func:`nested_format` for the values of a list
+    or dictionary, in order, as labels followed by (data, default,
+    tab_level) tuples.
+
+    Values are ``(value, default)`` pairs if they have exactly two items. If
+    one does not, the pairs before it are kept and all values are then
+    listed again as plain values. Pairs are detected by checking lengths
+    rather than by catching the error from unpacking.
+
+    Parameters
+    ----------
+    labels : `list`
+        Label to output before each value.
+    values : `Iterable`
+        Values of the list or dictionary.
+    tab_level : `int`
+        Number of tabs to indent the values with.
+
+    Returns
+    -------
+    `list`
+        Labels and tuples still to be formatted.
+    """
+    values = list(values)
+    n_pairs = next((i for i, v in enumerate(values) if not _is_pair(v)), len(values))
+    children = []
+    for label, (value, default) in zip(labels, values[:n_pairs]):
+        children.extend((label, (value, default, tab_level)))
+    if n_pairs < len(values):
+        for label, value in zip(labels, values):
+            children.extend((label, (value, False, tab_level)))
+    return children
+
+
+def _is_pair(x):
+    """
+    Returns ``True`` if *x* can be unpacked into exactly two values.
+    """
+    return isinstance(x, Sized) and isinstance(x, Iterable) and len(x) == 2
 
 
 def multi_index_tsv_to_dataframe(filepath, sep="\t", header_rows=None):
@@ -202,7 +287,8 @@ def infer_multiindex_header_rows(filepath):
     Infers which columns from a tsv file should be used as a header when
     loading a multi-index or single-index tsv. NaN values in the tsv
     must be encoded with the string 'NaN' for this function to correctly
-    infer header columns.
+    infer header columns. Only the first ``MAX_HEADER_ROWS`` rows are
+    considered.
 
     Parameters
     ----------
@@ -225,12 +311,13 @@ def infer_multiindex_header_rows(filepath):
     header_rows = []
     with open(filepath, "rt") as fp:
         for i, line in enumerate(fp):
-            xs = [x.strip() for x in line.split("\t") if x.strip()]
-            skip_line = (not xs) or any([is_number(s) for s in xs])
-            if skip_line:
+            if i >= MAX_HEADER_ROWS:
                 break
-            else:
-                header_rows.append(i)
+            xs = [x.strip() for x in line.split("\t")]
+            xs = [x for x in xs if x]
+            if not xs or any(is_number(s) for s in xs):
+                break
+            header_rows.append(i)
     return header_rows
 
 
@@ -248,19 +335,24 @@ def is_number(s):
     `bool`
         ``True`` if a string represents an integer or floating point number
     """
-    try:
-        int(s)
-        is_int = True
-    except ValueError:
-        is_int = False
+    # every string int() accepts is also accepted by float(), so a single
+    # parse is enough. Strings that cannot start a number, and words such as
+    # 'index' that start like 'inf' or 'nan', are rejected without raising
+    # an exception.
+    if isinstance(s, str):
+        if not s:
+            return False
+        c = s[0]
+        if c in _NON_FINITE_START:
+            return _NON_FINITE.fullmatch(s) is not None
+        if c not in _NUMBER_START and not c.isdecimal() and not c.isspace():
+            return False
 
     try:
         float(s)
-        is_float = True
+        return True
     except ValueError:
-        is_float = False
-
-    return is_float | is_int
+        return False
 
 
 def fix_filename(s):
@@ -278,9 +370,7 @@ def fix_filename(s):
     `str`
         Cleaned file name
     """
-    fname = "".join(c for c in s if c.isalnum() or c in (" ._~"))
-    fname = fname.replace(" ", "_")
-    return fname
+    return _INVALID_FILENAME_CHARS.sub("", s).replace(" ", "_")
 
 
 def compute_md5(fname):
@@ -298,11 +388,92 @@ def compute_md5(fname):
     `str`
         MD5 string of the hashed file.
     """
-    md5 = ""
+    return compute_file_hash(fname, algorithm="md5")
+
+
+def compute_file_hash(fname, algorithm=FILE_HASH_ALGORITHM):
+    """
+    Returns the hash of a file at some path, or an empty string
+    if the file does not exist. The file is read in blocks, so memory use
+    does not depend on the file size.
+
+    Parameters
+    ----------
+    fname : `str`
+        Path to file.
+    algorithm : `str`, optional, default: 'blake2b'
+        Name of a :py:mod:`hashlib` algorithm.
+
+    Returns
+    -------
+    `str`
+        Hexadecimal digest of the hashed file.
+    """
+    digest = ""
     if fname is None:
-        return md5
+        return digest
     if os.path.isfile(fname):
-        fp = open(fname, "rb")
-        md5 = hashlib.md5(fp.read()).hexdigest()
-        fp.close()
-    return md5
+        file_hash = hashlib.new(algorithm)
+        with open(fname, "rb") as fp:
+            for block in iter(lambda: fp.read(HASH_BLOCK_BYTES), b""):
+                file_hash.update(block)
+        digest = file_hash.hexdigest()
+    return digest
+
+
+def compute_file_hashes(fnames, algorithm=FILE_HASH_ALGORITHM, workers=None):
+    """
+    Hash several files in parallel threads with :py:func:`compute_file_hash`.
+    :py:mod:`hashlib` releases the GIL while hashing large blocks, so files
+    are read and hashed concurrently.
+
+    Parameters
+    ----------
+    fnames : `Iterable`
+        Paths to the files. Duplicates and ``None`` are skipped.
+    algorithm : `str`, optional, default: 'blake2b'
+        Name of a :py:mod:`hashlib` algorithm.
+    workers : `int`, optional, default: None
+        Maximum number of threads. Defaults to that of
+        :py:class:`~concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    `dict`
+        Hexadecimal digest of each file, keyed by path.
+    """
+    fnames = list(dict.fromkeys(f for f in fnames if f is not None))
+    if len(fnames) <= 1:
+        return {f: compute_file_hash(f, algorithm) for f in fnames}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(lambda f: compute_file_hash(f, algorithm), fnames)
+        return dict(zip(fnames, digests))
+
+
+def translate_dna(seq):
+    """
+    Translate a DNA sequence into single-letter amino acid codes using the
+    radix-indexed :py:const:`~countess.base.constants.CODON_LUT`.
+
+    Codons containing characters other than ``ACGT`` and a trailing
+    incomplete codon are translated as ``"?"``.
+
+    Parameters
+    ----------
+    seq : `str`
+        Uppercase DNA sequence.
+
+    Returns
+    -------
+    `str`
+        The translated protein sequence.
+    """
+    data = np.frombuffer(seq.encode("ascii"), dtype=np.uint8)
+    n_codons = len(data) // 3
+    digits = NT_RADIX[data[: n_codons * 3]].reshape(n_codons, 3).astype(np.intp)
+    index = 16 * digits[:, 0] + 4 * digits[:, 1] + digits[:, 2]
+    index[(digits > 3).any(axis=1)] = len(CODON_LUT) - 1
+    protein = CODON_LUT[index].tobytes().decode("ascii")
+    if len(data) % 3 != 0:
+        protein += "?"
+    return protein
@@ -42,10 +42,7 @@ def is_experiment(cfg):
         :py:class:`~enrich2.experiment.experiment.Experiment`, else False.
 
     """
-    if CONDITIONS in list(cfg.keys()):
-        return True
-    else:
-        return False
+    return CONDITIONS in cfg
 
 
 def is_condition(cfg):
@@ -64,10 +61,7 @@ def is_condition(cfg):
         True if `cfg` if specifies a 
         :py:class:`~enrich2.experiment.condition.Condition`, else False.
     """
-    if SELECTIONS in list(cfg.keys()):
-        return True
-    else:
-        return False
+    return SELECTIONS in cfg
 
 
 def is_selection(cfg):
@@ -86,10 +80,7 @@ def is_selection(cfg):
         True if `cfg` if specifies a 
         :py:class:`~enrich2.selection.selection.Selection`, else False.
     """
-    if LIBRARIES in list(cfg.keys()):
-        return True
-    else:
-        return False
+    return LIBRARIES in cfg
 
 
 def is_seqlib(cfg):
@@ -109,11 +100,7 @@ def is_seqlib(cfg):
         derived object, else False.
 
     """
-    keys = list(cfg.keys())
-    if FASTQ in keys or IDENTIFIERS in keys:
-        return True
-    else:
-        return False
+    return FASTQ in cfg or IDENTIFIERS in cfg
 
 
 def seqlib_type(cfg):
@@ -8,17 +8,21 @@ and contains validation methods to format input from a GUI configurator.
 """
 
 
-import re
 import os
 import sys
+import stat
+import copy
 import logging
+import functools
 from abc import ABC, abstractclassmethod
 
 from ..base.config_constants import *
-from ..base.utils import log_message
 from .config_check import *
-from ..plugins import load_scorer_class_and_options
-from ..plugins.options import Options
+
+# The plugin machinery and ``base.utils`` (which pulls in numpy and pandas)
+# are only needed to load scorers and log warnings, so they are imported
+# where they are used rather than here. This keeps importing the data
+# model cheap for code that only builds library configurations.
 
 
 __all__ = [
@@ -44,25 +48,231 @@ __all__ = [
 ]
 
 
+_TYPE_NAMES = {bool: "a boolean", int: "an integer", str: "a string"}
+
+_READS_EXTENSIONS = (".bz2", ".gz", ".fq", ".fastq")
+_MAP_FILE_EXTENSIONS = (".bz2", ".gz", ".txt")
+_FASTA_EXTENSIONS = (".bz2", ".gz", ".fa", ".fasta")
+_COUNTS_FILE_EXTENSIONS = (".tsv", ".txt")
+
+
+# Default for ``dict.get`` that tells a missing key apart from a ``None`` value.
+_MISSING = object()
+
+
+def _check_file_contents(path, label, binary=False):
+    """
+    Cheap checks on the file at *path* before it is handed to a parser.
+    Raises an `IOError` if it is not a regular file and, unless *binary* is
+    `True`, if it is empty or its first block contains NUL bytes.
+    """
+    st = os.stat(path)
+    if not stat.S_ISREG(st.st_mode):
+        raise IOError(f"{label} {path} is not a regular file.")
+    if not binary:
+        if st.st_size == 0:
+            raise IOError(f"{label} {path} is empty.")
+        with open(path, "rb") as handle:
+            if b"\x00" in handle.read(4096):
+                raise IOError(f"{label} {path} appears to be a binary file.")
+
+
+def _require_keys(cfg, required, section):
+    """
+    Raises a `KeyError` naming every key in *required* that is missing
+    from the *section* configuration `dict` *cfg*.
+    """
+    missing = [key for key in required if key not in cfg]
+    if missing:
+        raise KeyError(
+            "Missing {} key from {} configuration.".format(
+                ", ".join("'{}'".format(key) for key in missing), section
+            )
+        )
+
+
+def _require_dict(section):
+    """
+    Decorates a configuration ``__init__`` so that it raises a `TypeError`
+    unless its *cfg* argument is a `dict`.
+    """
+
+    def decorator(init):
+        @functools.wraps(init)
+        def wrapper(self, cfg, *args, **kwargs):
+            if not isinstance(cfg, dict):
+                raise TypeError("dict required for {}.".format(section))
+            return init(self, cfg, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _check_unique(names, message, *args):
+    """
+    Raises a `ValueError` as soon as a value in the iterable *names* repeats.
+    The error text is *message* formatted with *args*, which is only done
+    when a repeat is found.
+    """
+    seen = set()
+    for name in names:
+        if name in seen:
+            raise ValueError(message.format(*args))
+        seen.add(name)
+
+
+def _read_sequence_file(path):
+    """
+    Returns the whitespace-stripped, uppercased contents of the file at
+    *path*. Stripping and case conversion are done on the raw bytes before
+    a single ASCII decode; non-ASCII bytes decode to a replacement
+    character so that :py:func:`_is_atcg` rejects them.
+    """
+    # TODO: replace with fasta reader
+    with open(path, "rb") as fp:
+        return fp.read().strip().upper().decode("ascii", errors="replace")
+
+
+def _is_atcg(sequence):
+    """
+    Returns ``True`` if *sequence* consists only of the characters ``ACGT``.
+    Deleting those bytes with :py:meth:`bytes.translate` is a single C-level
+    pass, much cheaper than the regex engine on long reference sequences.
+    """
+    try:
+        raw = sequence.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    return not raw.translate(None, b"ACGT")
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_load_scorer(abs_path, mtime):
+    """
+    Memoized :py:func:`~enrich2.plugins.load_scorer_class_and_options` keyed
+    on the absolute plugin path and its modification time, so an edited
+    plugin is re-imported. Use ``_cached_load_scorer.cache_clear()`` to
+    drop every cached plugin.
+    """
+    from ..plugins import load_scorer_class_and_options
+
+    return load_scorer_class_and_options(abs_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls):
+    """
+    Returns the (name-mangled) slot names declared across the class
+    hierarchy of *cls*, base classes first.
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = "_{}{}".format(klass.__name__.lstrip("_"), name)
+            names.append(name)
+    return tuple(names)
+
+
+def _instance_attrs(obj):
+    """
+    Yields ``(name, value)`` for every assigned slot of *obj*, followed by
+    the items of its ``__dict__`` if the class has one.
+    """
+    for name in _slot_names(type(obj)):
+        try:
+            yield name, getattr(obj, name)
+        except AttributeError:
+            continue
+    yield from getattr(obj, "__dict__", {}).items()
+
+
 class Configuration(ABC):
     """
     Abtract class representing required operations on the data model.
+
+    Subclasses declare their simple type and range checks in ``_SCHEMA``
+    as ``(attribute, type, minimum, maximum, label)`` tuples, which are
+    applied by :py:meth:`validate_schema`. A bound of ``None`` is not
+    checked.
     """
 
+    __slots__ = ()
+
+    _SCHEMA = ()
+
+    def validate_schema(self):
+        """
+        Ensure each attribute listed in ``_SCHEMA`` has the expected type
+        and lies within its inclusive bounds.
+        """
+        for attr, type_, minimum, maximum, label in self._SCHEMA:
+            value = getattr(self, attr)
+            if not isinstance(value, type_):
+                raise TypeError(
+                    "{} must be {}. Found type {}.".format(
+                        label, _TYPE_NAMES[type_], type(value).__name__
+                    )
+                )
+            if minimum is not None and value < minimum:
+                if minimum == 0:
+                    raise ValueError("{} must not be negative.".format(label))
+                raise ValueError("{} must not be lower than {}.".format(label, minimum))
+            if maximum is not None and value > maximum:
+                raise ValueError(
+                    "{} should not be higher than {}.".format(label, maximum)
+                )
+
     def __rdict__(self):
         repr_dict = {}
-        for k, v in self.__dict__.items():
-            if isinstance(v, Configuration):
-                repr_dict[k] = v.__rdict__()
-            else:
-                repr_dict[k] = v
+        stack = [(self, repr_dict)]
+        while stack:
+            cfg, out = stack.pop()
+            for k, v in _instance_attrs(cfg):
+                if isinstance(v, Configuration):
+                    out[k] = {}
+                    stack.append((v, out[k]))
+                else:
+                    out[k] = v
         return repr_dict
 
     def __str__(self):
         return self.__repr__()
 
     def __repr__(self):
-        return str(self.__rdict__())
+        parts = []
+        self._write_repr(parts.append)
+        return "".join(parts)
+
+    def _write_repr(self, write):
+        """
+        Writes the text of ``str(self.__rdict__())`` piece by piece through
+        *write*, without building the intermediate nested `dict`.
+        """
+        write("{")
+        stack = [_instance_attrs(self)]
+        first = True
+        while stack:
+            for k, v in stack[-1]:
+                if not first:
+                    write(", ")
+                write(repr(k))
+                write(": ")
+                if isinstance(v, Configuration):
+                    write("{")
+                    stack.append(_instance_attrs(v))
+                    first = True
+                    break
+                write(repr(v))
+                first = False
+            else:
+                stack.pop()
+                write("}")
+                first = False
 
     @abstractclassmethod
     def validate(self):
@@ -108,24 +318,38 @@ class ScorerConfiguration(Configuration):
     
     """
 
+    __slots__ = (
+        "__options",
+        "__expected_varnames",
+        "scorer_class",
+        "scorer_class_attrs",
+        "scorer_path",
+    )
+
+    @_require_dict("scorer configuration")
     def __init__(self, cfg):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for fastq configuration.")
+        from ..plugins import load_scorer_class_and_options
+        from ..plugins.options import Options
 
-        if SCORER_PATH not in cfg:
-            raise KeyError(
-                "Missing '{}' key from {} configuration.".format(SCORER_PATH, SCORER)
-            )
-        if SCORER_OPTIONS not in cfg:
-            raise KeyError(
-                "Missing '{}' key from {} configuration.".format(SCORER_OPTIONS, SCORER)
-            )
+        _require_keys(cfg, (SCORER_PATH, SCORER_OPTIONS), SCORER)
 
         path = cfg[SCORER_PATH]
         attrs = cfg[SCORER_OPTIONS]
-        scorer_class, options, _ = load_scorer_class_and_options(path)
+        if isinstance(path, str):
+            abs_path = os.path.abspath(path)
+            try:
+                mtime = os.stat(abs_path).st_mtime_ns
+            except OSError:
+                raise IOError("Invalid plugin path {}.".format(path))
+            scorer_class, options, _ = _cached_load_scorer(abs_path, mtime)
+            # Options are set in place during validation so each
+            # configuration needs its own copy of the cached instance.
+            options = copy.deepcopy(options)
+        else:
+            scorer_class, options, _ = load_scorer_class_and_options(path)
 
         self.__options = options if options is not None else Options()
+        self.__expected_varnames = frozenset(self.__options.option_varnames())
         self.scorer_class = scorer_class
         self.scorer_class_attrs = attrs
         self.scorer_path = path
@@ -138,11 +362,11 @@ class ScorerConfiguration(Configuration):
         if self.scorer_class is None:
             raise TypeError("Scoring class cannot be NoneType.")
 
-        passed_varnames = set(self.scorer_class_attrs.keys())
-        expected_varnames = set(self.__options.option_varnames())
+        passed_varnames = self.scorer_class_attrs.keys()
+        expected_varnames = self.__expected_varnames
 
         # Check for unused params in attrs and throw error
-        unused = list(passed_varnames - expected_varnames)
+        unused = passed_varnames - expected_varnames
         unused_str = ", ".join(["'{}'".format(v) for v in unused])
         if unused:
             raise ValueError(
@@ -157,9 +381,11 @@ class ScorerConfiguration(Configuration):
             self.__options.set_option_by_varname(varname, value)
 
         # If missing params log warning and set to default
-        defaults = list(expected_varnames - passed_varnames)
+        defaults = expected_varnames - passed_varnames
         defaults_str = ", ".join(["'{}'".format(v) for v in defaults])
         if defaults:
+            from ..base.utils import log_message
+
             log_message(
                 logging_callback=logging.warning,
                 msg="The options {} were not found in the provided"
@@ -221,9 +447,6 @@ class FASTQConfiguration(Configuration):
     validate
         Validate the instance instantiated from a `dict` using the methods
         below.
-    validate_reverse
-    validate_trim_start
-    validate_trim_length
     validate_reads
 
     See Also
@@ -233,55 +456,28 @@ class FASTQConfiguration(Configuration):
 
     """
 
-    def __init__(self, cfg):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for fastq configuration.")
+    __slots__ = ("reads", "reverse", "trim_start", "trim_length", "filters_cfg")
 
-        if READS not in cfg:
-            raise KeyError(
-                "Missing '{}' key from {} configuration.".format(READS, FASTQ)
-            )
+    _SCHEMA = (
+        ("reverse", bool, None, None, "FASTQ `reverse`"),
+        ("trim_start", int, 0, None, "FASTQ `start`"),
+        ("trim_length", int, 0, None, "FASTQ `length`"),
+    )
+
+    @_require_dict("fastq configuration")
+    def __init__(self, cfg, bypass_validators=False):
+        _require_keys(cfg, (READS,), FASTQ)
 
         filters_cfg = cfg.get(FILTERS, {})
         self.reads = cfg.get(READS, "")
         self.reverse = cfg.get(REVERSE, False)
         self.trim_start = cfg.get(TRIM_START, 1)
         self.trim_length = cfg.get(TRIM_LENGTH, sys.maxsize)
-        self.filters_cfg = FiltersConfiguration(filters_cfg)
-        self.validate()
-
-    def validate_reverse(self):
-        """
-        Check if reverse if a boolean
-        """
-        if not isinstance(self.reverse, bool):
-            raise TypeError(
-                "Expected bool for reverse but found {}.".format(type(self.reverse))
-            )
-
-    def validate_trim_start(self):
-        """
-        Validate the `trim_start` value
-        """
-        if not isinstance(self.trim_start, int):
-            raise TypeError(
-                "FASTQ `start` must be an integer."
-                " Found type {}.".format(type(self.trim_start))
-            )
-        if self.trim_start < 0:
-            raise ValueError("FASTQ `start` must not be negative.")
-
-    def validate_trim_length(self):
-        """
-        Validate the `trim_length` value
-        """
-        if not isinstance(self.trim_length, int):
-            raise TypeError(
-                "FASTQ `length` must be an integer."
-                " Found type {}.".format(type(self.trim_length))
-            )
-        if self.trim_length < 0:
-            raise ValueError("FASTQ `length` must not be negative.")
+        self.filters_cfg = FiltersConfiguration(
+            filters_cfg, bypass_validators=bypass_validators
+        )
+        if not bypass_validators:
+            self.validate()
 
     def validate_reads(self):
         """
@@ -297,9 +493,7 @@ class FASTQConfiguration(Configuration):
                 " Try using absolute paths.".format(self.reads)
             )
 
-        _, tail = os.path.split(self.reads)
-        _, ext = os.path.splitext(tail)
-        if ext not in {".bz2", ".gz", ".fq", ".fastq"}:
+        if not self.reads.lower().endswith(_READS_EXTENSIONS):
             raise IOError(
                 "Unsupported format for reads. Files"
                 "need extension to be either bz2, gz, fq or"
@@ -310,9 +504,7 @@ class FASTQConfiguration(Configuration):
         """
         Validate all attributes. Overrides parent method.
         """
-        self.validate_reverse()
-        self.validate_trim_start()
-        self.validate_trim_length()
+        self.validate_schema()
         self.validate_reads()
         self.filters_cfg.validate()
         return self
@@ -344,10 +536,6 @@ class FiltersConfiguration(Configuration):
     validate
         Validate the instance instantiated from a `dict` using the methods
         below.
-    validate_max_n
-    validate_chaste
-    validate_avg_base_quality
-    validate_min_base_quality
     to_dict
 
     See Also
@@ -356,86 +544,61 @@ class FiltersConfiguration(Configuration):
 
     """
 
-    def __init__(self, cfg):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for filters configuration.")
-
+    __slots__ = (
+        "chaste",
+        "max_n",
+        "avg_base_quality",
+        "min_base_quality",
+        "_to_dict_cache",
+    )
+
+    _SCHEMA = (
+        ("chaste", bool, None, None, "FASTQ filter `chastity`"),
+        ("max_n", int, 0, None, "FASTQ filter `max n`"),
+        ("avg_base_quality", int, 0, None, "FASTQ filter `avg quality`"),
+        ("min_base_quality", int, 0, None, "FASTQ filter `min quality`"),
+    )
+
+    @_require_dict("filters configuration")
+    def __init__(self, cfg, bypass_validators=False):
         self.chaste = cfg.get(FILTERS_CHASTITY, False)
         self.max_n = cfg.get(FILTERS_MAX_N, sys.maxsize)
         self.avg_base_quality = cfg.get(FILTERS_AVG_Q, 0)
         self.min_base_quality = cfg.get(FILTERS_MIN_Q, 0)
-        self.validate()
+        if not bypass_validators:
+            self.validate()
 
-    def validate_max_n(self):
-        """
-        Ensure that `max_n` is an `int` and not negative.
-        """
-        if not isinstance(self.max_n, int):
-            raise TypeError(
-                "FASTQ filter `max n` must be an integer."
-                " Found type {}.".format(type(self.max_n))
-            )
-        if self.max_n < 0:
-            raise ValueError("FASTQ filter `max n` must not be negative.")
-
-    def validate_chaste(self):
-        """
-        Ensure that `chaste` is a `bool`.
-        """
-        if not isinstance(self.chaste, bool):
-            raise TypeError(
-                "FASTQ filter `chastity` must be a boolean."
-                " Found type {}.".format(type(self.max_n))
-            )
-
-    def validate_avg_base_quality(self):
-        """
-        Ensure that `avg_base_quality` is an `int` and not negative.
-        """
-        if not isinstance(self.avg_base_quality, int):
-            raise TypeError(
-                "FASTQ filter `avg quality` must be an integer."
-                " Found type {}.".format(type(self.max_n))
-            )
-        if self.avg_base_quality < 0:
-            raise ValueError("FASTQ filter " "`avg quality` must not be negative.")
-
-    def validate_min_base_quality(self):
-        """
-        Ensure that `min_base_quality` is an `int` and not negative.
-        """
-        if not isinstance(self.min_base_quality, int):
-            raise TypeError(
-                "FASTQ filter `min quality` must be an integer."
-                " Found type {}.".format(type(self.max_n))
-            )
-        if self.min_base_quality < 0:
-            raise ValueError("FASTQ filter " "`min quality` must not be negative.")
+    def __setattr__(self, name, value):
+        # Any change to a filter value invalidates the cached dict.
+        if name != "_to_dict_cache":
+            object.__setattr__(self, "_to_dict_cache", None)
+        object.__setattr__(self, name, value)
 
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
-        self.validate_chaste()
-        self.validate_max_n()
-        self.validate_avg_base_quality()
-        self.validate_min_base_quality()
+        self.validate_schema()
         return self
 
     def to_dict(self):
         """
-        Serialize current attributes into a `dict`
+        Serialize current attributes into a `dict`. The `dict` is built once
+        and returned again until an attribute is reassigned, so callers
+        must not modify it.
         
         Returns
         -------
         `dict`
         """
-        return {
-            FILTERS_CHASTITY: self.chaste,
-            FILTERS_MAX_N: self.max_n,
-            FILTERS_MIN_Q: self.min_base_quality,
-            FILTERS_AVG_Q: self.avg_base_quality,
-        }
+        if self._to_dict_cache is None:
+            self._to_dict_cache = {
+                FILTERS_CHASTITY: self.chaste,
+                FILTERS_MAX_N: self.max_n,
+                FILTERS_MIN_Q: self.min_base_quality,
+                FILTERS_AVG_Q: self.avg_base_quality,
+            }
+        return self._to_dict_cache
 
 
 class BarcodeConfiguration(Configuration):
@@ -461,13 +624,15 @@ class BarcodeConfiguration(Configuration):
     -------
     validate
     validate_map_file
-    validate_min_count
     
     """
 
-    def __init__(self, cfg, require_map=False):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for barcodes configuration.")
+    __slots__ = ("min_count", "map_file", "barcodemap")
+
+    _SCHEMA = (("min_count", int, 0, None, "Barcode `min count`"),)
+
+    @_require_dict("barcodes configuration")
+    def __init__(self, cfg, require_map=False, bypass_validators=False):
         if not isinstance(require_map, bool):
             raise TypeError("Argument 'require_map' must be a boolean.")
 
@@ -478,47 +643,35 @@ class BarcodeConfiguration(Configuration):
             raise ValueError("Map file cannot be empty.")
 
         self.barcodemap = None
-        self.validate()
+        if not bypass_validators:
+            self.validate()
 
     def validate_map_file(self):
         """
         Ensure that `map_file` exists and has an appropriate extension.
         """
-        if self.map_file and not isinstance(self.map_file, str):
+        if not self.map_file:
+            return
+        if not isinstance(self.map_file, str):
             raise TypeError(
                 "Expected str for map file but found {}.".format(type(self.map_file))
             )
-        if self.map_file and not os.path.isfile(self.map_file):
+        if not os.path.isfile(self.map_file):
             raise IOError(
                 "File {} does not exist."
                 " Try using absolute paths.".format(self.map_file)
             )
-        elif self.map_file and os.path.isfile(self.map_file):
-            _, tail = os.path.split(self.map_file)
-            _, ext = os.path.splitext(tail)
-            if ext not in {".bz2", ".gz", ".txt"}:
-                raise IOError(
-                    "Unsupported format for map file. Files"
-                    "need extension to be either bz2, gz or txt."
-                )
-
-    def validate_min_count(self):
-        """
-        Ensure that `min_count` is an `int` and not negative.
-        """
-        if not isinstance(self.min_count, int):
-            raise TypeError(
-                "Barcode `min count` must be an integer."
-                " Found type {}".format(type(self.min_count))
+        if not self.map_file.lower().endswith(_MAP_FILE_EXTENSIONS):
+            raise IOError(
+                "Unsupported format for map file. Files "
+                "need extension to be either bz2, gz or txt."
             )
-        if self.min_count < 0:
-            raise ValueError("Barcode `min count` must not be negative.")
 
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
-        self.validate_min_count()
+        self.validate_schema()
         self.validate_map_file()
         return self
 
@@ -541,33 +694,24 @@ class IdentifiersConfiguration(Configuration):
     Methods
     -------
     validate
-    validate_min_count
 
     """
 
-    def __init__(self, cfg):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for identifiers configuration.")
-        self.min_count = cfg.get(IDENTIFIERS_MIN_COUNT, 0)
-        self.validate()
+    __slots__ = ("min_count",)
 
-    def validate_min_count(self):
-        """
-        Ensure that `min_count` is an `int` and not negative.
-        """
-        if not isinstance(self.min_count, int):
-            raise TypeError(
-                "Identifers `min count` must be an integer."
-                " Found type {}".format(type(self.min_count))
-            )
-        if self.min_count < 0:
-            raise ValueError("Identifers `min count` must not be negative.")
+    _SCHEMA = (("min_count", int, 0, None, "Identifers `min count`"),)
+
+    @_require_dict("identifiers configuration")
+    def __init__(self, cfg, bypass_validators=False):
+        self.min_count = cfg.get(IDENTIFIERS_MIN_COUNT, 0)
+        if not bypass_validators:
+            self.validate()
 
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
-        self.validate_min_count()
+        self.validate_schema()
         return self
 
 
@@ -596,82 +740,48 @@ class VariantsConfiguration(Configuration):
     -------
     validate
     validate_use_aligner
-    validate_max_mutations
-    validate_min_count
 
     """
 
+    __slots__ = ("use_aligner", "max_mutations", "min_count", "wildtype_cfg")
+
     DEFAULT_MAX_MUTATIONS = 10
 
-    def __init__(self, cfg):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for variants configuration.")
+    _SCHEMA = (
+        ("max_mutations", int, 0, DEFAULT_MAX_MUTATIONS, "Variants `max mutations`"),
+        ("min_count", int, 0, None, "Variants `min count`"),
+        ("use_aligner", bool, None, None, "Variants `use aligner`"),
+    )
 
-        if WILDTYPE not in cfg:
-            raise KeyError(
-                "Missing '{}' key from {} configuration.".format(WILDTYPE, VARIANTS)
-            )
+    @_require_dict("variants configuration")
+    def __init__(self, cfg, bypass_validators=False):
+        _require_keys(cfg, (WILDTYPE,), VARIANTS)
 
         wildtype_cfg = cfg.get(WILDTYPE, {})
         self.use_aligner = cfg.get(USE_ALIGNER, False)
         self.max_mutations = cfg.get(VARIANTS_MAX_MUTATIONS, self.DEFAULT_MAX_MUTATIONS)
         self.min_count = cfg.get(VARIANTS_MIN_COUNT, 0)
-        self.wildtype_cfg = WildTypeConfiguration(wildtype_cfg).validate()
-        self.validate()
+        # The wildtype always validates: it loads and normalises the sequence.
+        self.wildtype_cfg = WildTypeConfiguration(wildtype_cfg)
+        if not bypass_validators:
+            self.validate()
 
     def validate_use_aligner(self):
         """
-        Ensure that `use_aligner` is a `bool` and the wildtype configuration
-        contains a valid sequence.
+        Ensure that the wildtype configuration contains a valid sequence
+        if `use_aligner` is set.
         """
-        if not isinstance(self.use_aligner, bool):
-            raise TypeError(
-                "Variants `use aligner` must be a boolean."
-                " Found type {}.".format(type(self.use_aligner))
-            )
         if self.use_aligner and not self.wildtype_cfg.sequence:
             raise ValueError(
                 "Variants `use aligner` requires a wildtype" "sequence to be present."
             )
 
-    def validate_max_mutations(self):
-        """
-        Ensure that `max_mutations` is an `int`, not negative and not greater 
-        than 10.
-        """
-        if not isinstance(self.max_mutations, int):
-            raise TypeError(
-                "Variants `max mutations` must be an integer."
-                " Found type {}".format(type(self.min_count))
-            )
-        if self.max_mutations < 0:
-            raise ValueError("Variants `max mutations` must not be negative.")
-
-        if self.max_mutations > self.DEFAULT_MAX_MUTATIONS:
-            raise ValueError(
-                "Variants `max mutations` should not be higher "
-                "than {}.".format(self.DEFAULT_MAX_MUTATIONS)
-            )
-
-    def validate_min_count(self):
-        """
-        Ensure that `min_count` is an `int` and not negative.
-        """
-        if not isinstance(self.min_count, int):
-            raise TypeError(
-                "Variants `min count` must be an integer."
-                " Found type {}".format(type(self.min_count))
-            )
-        if self.min_count < 0:
-            raise ValueError("Variants `min count` must not be negative.")
-
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
         self.wildtype_cfg.validate()
-        self.validate_max_mutations()
-        self.validate_min_count()
+        self.validate_schema()
         self.validate_use_aligner()
         return self
 
@@ -700,20 +810,21 @@ class WildTypeConfiguration(Configuration):
     Methods
     -------
     validate
-    validate_coding
     validate_reference_offset
     validate_sequence
 
     """
 
-    def __init__(self, cfg):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for wildtype configuration.")
+    __slots__ = ("coding", "reference_offset", "sequence")
 
-        if SEQUENCE not in cfg:
-            raise KeyError(
-                "Missing '{}' from base library " "configuration.".format(SEQUENCE)
-            )
+    _SCHEMA = (
+        ("coding", bool, None, None, "Wildtype `coding`"),
+        ("reference_offset", int, 0, None, "Wildtype `reference offset`"),
+    )
+
+    @_require_dict("wildtype configuration")
+    def __init__(self, cfg):
+        _require_keys(cfg, (SEQUENCE,), WILDTYPE)
 
         self.coding = cfg.get(CODING, False)
         self.reference_offset = cfg.get(REF_OFFSET, 0)
@@ -724,36 +835,15 @@ class WildTypeConfiguration(Configuration):
         """
         Validate all attributes. Overrides parent method.
         """
-        self.validate_coding()
+        self.validate_schema()
         self.validate_sequence()
         self.validate_reference_offset()
         return self
 
-    def validate_coding(self):
-        """
-        Ensure that `coding` is a `bool`.
-        """
-        if not isinstance(self.coding, bool):
-            raise TypeError(
-                "Wildtype `coding` must be a boolean."
-                " Found type "
-                "{}.".format(type(self.coding).__name__)
-            )
-
     def validate_reference_offset(self):
         """
-        Ensure that reference offset is a valid integer input. Sets to 0
-        if `coding` and not a multiple of 3.
+        Ensure that reference offset is a multiple of 3 if `coding`.
         """
-        if not isinstance(self.reference_offset, int):
-            raise TypeError(
-                "Wildtype `reference offset` "
-                "must be an integer. Found type "
-                "{}.".format(type(self.reference_offset).__name__)
-            )
-        if self.reference_offset < 0:
-            raise ValueError("Wildtype `reference offset` " "must not be negative.")
-
         multiple_of_three = self.reference_offset % 3 == 0
         if self.coding and not multiple_of_three:
             raise ValueError("WT DNA sequence contains incomplete codons")
@@ -777,25 +867,18 @@ class WildTypeConfiguration(Configuration):
                 )
             )
 
-        if self.sequence and os.path.isfile(self.sequence):
-            _, tail = os.path.split(self.sequence)
-            _, ext = os.path.splitext(tail)
-            if ext not in {".bz2", ".gz", ".fa", "fasta"}:
+        if os.path.isfile(self.sequence):
+            if not self.sequence.lower().endswith(_FASTA_EXTENSIONS):
                 raise IOError(
                     "Unsupported format for fasta file. Files"
                     " need extension to be either bz2, gz, "
                     "fa or fasta."
                 )
-
-        if os.path.isfile(self.sequence):
-            with open(self.sequence, "rt") as fp:
-                # TODO: replace with fasta reader
-                self.sequence = fp.read().strip()
-
-        self.sequence = self.sequence.upper()
-        atcg_chars_only = "^[ACGT]+$"
+            self.sequence = _read_sequence_file(self.sequence)
+        else:
+            self.sequence = self.sequence.upper()
         if self.sequence:
-            if not re.match(atcg_chars_only, self.sequence):
+            if not _is_atcg(self.sequence):
                 raise ValueError(
                     "'sequence' contains unexpected "
                     "characters {}".format(self.sequence)
@@ -827,6 +910,9 @@ class BaseLibraryConfiguration(Configuration):
         Set to `True` if `cfg` contains a fastq configuration `dict` that 
         should also be parsed and validated. Not all sequence libraries
         are to be parsed from reads.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
     
     Attributes
     ----------
@@ -847,37 +933,47 @@ class BaseLibraryConfiguration(Configuration):
     Methods
     -------
     validate
-    validate_timepoint
-    validate_report_filtered_reads
     validate_counts_file
 
     """
 
-    def __init__(self, cfg, init_fastq=False):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for base library configuration.")
+    __slots__ = (
+        "counts_file",
+        "fastq_cfg",
+        "seqlib_type",
+        "timepoint",
+        "report_filtered_reads",
+        "store_cfg",
+    )
+
+    _SCHEMA = (
+        ("report_filtered_reads", bool, None, None, "Library `report filtered reads`"),
+        ("timepoint", int, 0, None, "Library `timepoint`"),
+    )
+
+    @_require_dict("base library configuration")
+    def __init__(self, cfg, init_fastq=False, bypass_validators=False):
         if not isinstance(init_fastq, bool):
             raise TypeError("'init_fastq' needs to be a boolean.")
 
-        if TIMEPOINT not in cfg:
-            raise KeyError(
-                "Missing '{}' from base library " "configuration.".format(TIMEPOINT)
-            )
+        _require_keys(cfg, (TIMEPOINT,), "base library")
 
         if init_fastq and FASTQ not in cfg:
             raise KeyError(
-                "Missing '{}' from base library " "configuration.".format(FASTQ)
+                f"Missing '{FASTQ}' from base library configuration."
             )
 
         if not init_fastq and COUNTS_FILE not in cfg:
             raise KeyError(
-                "Missing '{}' from base library " "configuration.".format(COUNTS_FILE)
+                f"Missing '{COUNTS_FILE}' from base library configuration."
             )
 
         fastq_cfg = cfg.get(FASTQ, None)
         self.counts_file = cfg.get(COUNTS_FILE, None)
         if init_fastq:
-            self.fastq_cfg = FASTQConfiguration(fastq_cfg).validate()
+            self.fastq_cfg = FASTQConfiguration(
+                fastq_cfg, bypass_validators=bypass_validators
+            )
         else:
             self.fastq_cfg = None
 
@@ -898,41 +994,21 @@ class BaseLibraryConfiguration(Configuration):
         if fastq_cfg is None and self.counts_file is None:
             raise ValueError("Must have either a fastq definition or counts file.")
 
-        self.store_cfg = StoreConfiguration(cfg, has_scorer=False).validate()
-        self.validate()
+        self.store_cfg = StoreConfiguration(
+            cfg, has_scorer=False, bypass_validators=bypass_validators
+        )
+        # Subclasses validate once their own sections have been parsed.
+        if type(self) is BaseLibraryConfiguration and not bypass_validators:
+            self.validate()
 
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
-        self.validate_report_filtered_reads()
-        self.validate_timepoint()
+        self.validate_schema()
         self.validate_counts_file()
         return self
 
-    def validate_timepoint(self):
-        """
-        Ensure that the timpoint of this library is an integer and not less
-        than 0.
-        """
-        if not isinstance(self.timepoint, int):
-            raise TypeError(
-                "Library `timepoint` must be an integer."
-                " Found type {}.".format(type(self.timepoint))
-            )
-        if self.timepoint < 0:
-            raise ValueError("Library `timepoint` must not be negative.")
-
-    def validate_report_filtered_reads(self):
-        """
-        Check `report_filtered_reads` is a boolean.
-        """
-        if not isinstance(self.report_filtered_reads, bool):
-            raise TypeError(
-                "Expected bool for `report filtered reads`"
-                " but found {}.".format(type(self.report_filtered_reads))
-            )
-
     def validate_counts_file(self):
         """
         Validate a counts file if it exists. Will throw an error if both a
@@ -945,22 +1021,21 @@ class BaseLibraryConfiguration(Configuration):
         if self.counts_file and not isinstance(self.counts_file, str):
             raise TypeError(
                 "Expected str for `counts file` but "
-                "found {}.".format(type(self.counts_file))
+                f"found {type(self.counts_file)}."
             )
 
         if self.counts_file and not os.path.isfile(self.counts_file):
             raise IOError(
-                "File {} does not exist. Try using "
-                "absolute paths.".format(self.counts_file)
+                f"File {self.counts_file} does not exist. Try using "
+                "absolute paths."
             )
-        elif self.counts_file and os.path.isfile(self.counts_file):
-            _, tail = os.path.split(self.counts_file)
-            _, ext = os.path.splitext(tail)
-            if ext not in {".tsv", ".txt"}:
+        elif self.counts_file:
+            if not self.counts_file.lower().endswith(_COUNTS_FILE_EXTENSIONS):
                 raise IOError(
-                    "Unsupported format for `counts file`. Files"
-                    "need extension to be either bz2, gz or txt."
+                    "Unsupported format for `counts file`. Files "
+                    "need extension to be either tsv or txt."
                 )
+            _check_file_contents(self.counts_file, "Counts file")
 
 
 class BaseVariantSeqLibConfiguration(BaseLibraryConfiguration):
@@ -977,6 +1052,9 @@ class BaseVariantSeqLibConfiguration(BaseLibraryConfiguration):
         Set to `True` if `cfg` contains a fastq configuration `dict` that 
         should also be parsed and validated. Not all sequence libraries
         are to be parsed from reads.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
 
     Attributes
     ----------
@@ -989,22 +1067,30 @@ class BaseVariantSeqLibConfiguration(BaseLibraryConfiguration):
     
     """
 
-    def __init__(self, cfg, init_fastq=False):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for BaseVariantSeqLibConfiguration.")
-        BaseLibraryConfiguration.__init__(self, cfg, init_fastq)
+    __slots__ = ("variants_cfg",)
+
+    @_require_dict("BaseVariantSeqLibConfiguration")
+    def __init__(self, cfg, init_fastq=False, bypass_validators=False):
+        BaseLibraryConfiguration.__init__(self, cfg, init_fastq, bypass_validators)
+        self._init_variants_cfg(cfg, bypass_validators)
+        if type(self) is BaseVariantSeqLibConfiguration and not bypass_validators:
+            self.validate()
 
-        if VARIANTS not in cfg:
+    def _init_variants_cfg(self, cfg, bypass_validators=False):
+        """
+        Parse the variants section of *cfg* into `variants_cfg`.
+        """
+        variants_cfg = cfg.get(VARIANTS, _MISSING)
+        if variants_cfg is _MISSING:
             raise KeyError(
-                "Key {} missing for BcvSeqLib " "configuration.".format(VARIANTS)
+                f"Key {VARIANTS} missing for BcvSeqLib configuration."
             )
-
-        variants_cfg = cfg.get(VARIANTS, {})
         if not variants_cfg:
             raise ValueError("Variants configuration cannot be empty.")
 
-        self.variants_cfg = VariantsConfiguration(variants_cfg).validate()
-        self.validate()
+        self.variants_cfg = VariantsConfiguration(
+            variants_cfg, bypass_validators=bypass_validators
+        )
 
 
 class BarcodeSeqLibConfiguration(BaseLibraryConfiguration):
@@ -1025,6 +1111,9 @@ class BarcodeSeqLibConfiguration(BaseLibraryConfiguration):
     reqiure_map : `bool`, default `False`
         Specifies that the :py:class:`BarcodeConfiguration` should initialise
         and validate a `map_file`.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
 
     Attributes
     ----------
@@ -1038,19 +1127,32 @@ class BarcodeSeqLibConfiguration(BaseLibraryConfiguration):
 
     """
 
-    def __init__(self, cfg, init_fastq=True, reqiure_map=False):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for BarcodeSeqLibConfiguration.")
-        BaseLibraryConfiguration.__init__(self, cfg, init_fastq)
+    # No __slots__ here: BcvSeqLibConfiguration also derives from
+    # BaseVariantSeqLibConfiguration, and two bases adding slots cannot be
+    # combined. The barcode libraries keep their attributes in __dict__.
 
-        if BARCODES not in cfg:
+    @_require_dict("BarcodeSeqLibConfiguration")
+    def __init__(
+        self, cfg, init_fastq=True, reqiure_map=False, bypass_validators=False
+    ):
+        BaseLibraryConfiguration.__init__(self, cfg, init_fastq, bypass_validators)
+        self._init_barcodes_cfg(cfg, reqiure_map, bypass_validators)
+        if type(self) is BarcodeSeqLibConfiguration and not bypass_validators:
+            self.validate()
+
+    def _init_barcodes_cfg(self, cfg, reqiure_map, bypass_validators=False):
+        """
+        Parse the barcodes section of *cfg* into `barcodes_cfg`.
+        """
+        barcodes_cfg = cfg.get(BARCODES, _MISSING)
+        if barcodes_cfg is _MISSING:
             raise KeyError(
-                "Key {} missing for BarcodeSeqLib " "configuration.".format(BARCODES)
+                f"Key {BARCODES} missing for BarcodeSeqLib configuration."
             )
-        barcodes_cfg = cfg.get(BARCODES)
 
-        self.barcodes_cfg = BarcodeConfiguration(barcodes_cfg, reqiure_map).validate()
-        self.validate()
+        self.barcodes_cfg = BarcodeConfiguration(
+            barcodes_cfg, reqiure_map, bypass_validators=bypass_validators
+        )
 
 
 class BcidSeqLibConfiguration(BarcodeSeqLibConfiguration):
@@ -1068,6 +1170,9 @@ class BcidSeqLibConfiguration(BarcodeSeqLibConfiguration):
         Set to `True` if `cfg` contains a fastq configuration `dict` that 
         should also be parsed and validated. Not all sequence libraries
         are to be parsed from reads.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
 
     Attributes
     ----------
@@ -1081,21 +1186,24 @@ class BcidSeqLibConfiguration(BarcodeSeqLibConfiguration):
 
     """
 
-    def __init__(self, cfg, init_fastq=True):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for BcidSeqLibConfiguration.")
-
-        if IDENTIFIERS not in cfg:
+    @_require_dict("BcidSeqLibConfiguration")
+    def __init__(self, cfg, init_fastq=True, bypass_validators=False):
+        identifers_cfg = cfg.get(IDENTIFIERS, _MISSING)
+        if identifers_cfg is _MISSING:
             raise KeyError(
-                "Key {} missing for BcidSeqLib " "configuration.".format(IDENTIFIERS)
+                f"Key {IDENTIFIERS} missing for BcidSeqLib configuration."
             )
 
-        BarcodeSeqLibConfiguration.__init__(self, cfg, init_fastq, reqiure_map=True)
+        BarcodeSeqLibConfiguration.__init__(
+            self, cfg, init_fastq, reqiure_map=True, bypass_validators=bypass_validators
+        )
 
-        identifers_cfg = cfg.get(IDENTIFIERS)
-        identifers_cfg = IdentifiersConfiguration(identifers_cfg).validate()
+        identifers_cfg = IdentifiersConfiguration(
+            identifers_cfg, bypass_validators=bypass_validators
+        )
 
-        self.validate()
+        if not bypass_validators:
+            self.validate()
         self.identifers_cfg = identifers_cfg
 
 
@@ -1117,6 +1225,9 @@ class BcvSeqLibConfiguration(
         Set to `True` if `cfg` contains a fastq configuration `dict` that 
         should also be parsed and validated. Not all sequence libraries
         are to be parsed from reads.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
 
     See Also
     --------
@@ -1125,14 +1236,16 @@ class BcvSeqLibConfiguration(
 
     """
 
-    def __init__(self, cfg, init_fastq=True):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for BcvSeqLibConfiguration.")
-
-        BaseVariantSeqLibConfiguration.__init__(self, cfg, init_fastq)
-        BarcodeSeqLibConfiguration.__init__(self, cfg, init_fastq, reqiure_map=True)
+    @_require_dict("BcvSeqLibConfiguration")
+    def __init__(self, cfg, init_fastq=True, bypass_validators=False):
+        # Both parents share BaseLibraryConfiguration, so parse it once and
+        # then add each parent's own section.
+        BaseLibraryConfiguration.__init__(self, cfg, init_fastq, bypass_validators)
+        self._init_variants_cfg(cfg, bypass_validators)
+        self._init_barcodes_cfg(cfg, True, bypass_validators)
 
-        self.validate()
+        if not bypass_validators:
+            self.validate()
 
 
 class IdOnlySeqLibConfiguration(BaseLibraryConfiguration):
@@ -1146,6 +1259,9 @@ class IdOnlySeqLibConfiguration(BaseLibraryConfiguration):
     ----------
     cfg : `dict`
         The dictionary parsed from a configuration file.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
 
     Attributes
     ----------
@@ -1159,16 +1275,21 @@ class IdOnlySeqLibConfiguration(BaseLibraryConfiguration):
 
     """
 
-    def __init__(self, cfg):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for IdOnlySeqLib configuration.")
+    __slots__ = ("identifiers_cfg",)
 
-        BaseLibraryConfiguration.__init__(self, cfg, init_fastq=False)
+    @_require_dict("IdOnlySeqLib configuration")
+    def __init__(self, cfg, bypass_validators=False):
+        BaseLibraryConfiguration.__init__(
+            self, cfg, init_fastq=False, bypass_validators=bypass_validators
+        )
         identifiers_cfg = cfg.get(IDENTIFIERS, {})
-        identifiers_cfg = IdentifiersConfiguration(identifiers_cfg).validate()
+        identifiers_cfg = IdentifiersConfiguration(
+            identifiers_cfg, bypass_validators=bypass_validators
+        )
 
         self.identifiers_cfg = identifiers_cfg
-        self.validate()
+        if not bypass_validators:
+            self.validate()
 
 
 class BasicSeqLibConfiguration(BaseVariantSeqLibConfiguration):
@@ -1182,6 +1303,9 @@ class BasicSeqLibConfiguration(BaseVariantSeqLibConfiguration):
     ----------
     cfg : `dict`
         The dictionary parsed from a configuration file.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
 
     See Also
     --------
@@ -1189,13 +1313,16 @@ class BasicSeqLibConfiguration(BaseVariantSeqLibConfiguration):
 
     """
 
-    def __init__(self, cfg, init_fastq=True):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for BasicSeqLibConfiguration.")
+    __slots__ = ()
 
-        BaseVariantSeqLibConfiguration.__init__(self, cfg, init_fastq)
+    @_require_dict("BasicSeqLibConfiguration")
+    def __init__(self, cfg, init_fastq=True, bypass_validators=False):
+        BaseVariantSeqLibConfiguration.__init__(
+            self, cfg, init_fastq, bypass_validators
+        )
 
-        self.validate()
+        if not bypass_validators:
+            self.validate()
 
 
 # -------------------------------------------------------------------------- #
@@ -1215,6 +1342,10 @@ class ExperimentConfiguration(Configuration):
     cfg : `dict`
         The dictionary parsed from a configuration file.
     init_from_gui : `bool`, Default `False`
+    bypass_validators : `bool`, Default `False`
+        Skip validating this configuration and the configurations nested in
+        it after they are parsed, e.g. when reloading a configuration that
+        has already been validated.
     
     Attributes
     ----------
@@ -1230,67 +1361,80 @@ class ExperimentConfiguration(Configuration):
 
     """
 
-    def __init__(self, cfg, init_from_gui=False):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for experiment configuration.")
+    __slots__ = ("store_cfg", "condition_cfgs")
 
-        if CONDITIONS not in cfg:
+    @_require_dict("experiment configuration")
+    def __init__(self, cfg, init_from_gui=False, bypass_validators=False):
+        condition_cfgs = cfg.get(CONDITIONS, _MISSING)
+        if condition_cfgs is _MISSING:
             raise KeyError(
-                "Missing required config value `{}` [{}]"
-                "".format(CONDITIONS, self.__class__.__name__)
+                f"Missing required config value `{CONDITIONS}` "
+                f"[{self.__class__.__name__}]"
             )
 
         has_scorer = not init_from_gui
         if not init_from_gui:
             if SCORER not in cfg:
                 raise KeyError(
-                    "Missing required config value `{}` [{}]"
-                    "".format(SCORER, self.__class__.__name__)
+                    f"Missing required config value `{SCORER}` "
+                    f"[{self.__class__.__name__}]"
                 )
 
-        self.store_cfg = StoreConfiguration(cfg, has_scorer).validate()
+        self.store_cfg = StoreConfiguration(
+            cfg, has_scorer, bypass_validators=bypass_validators
+        )
 
-        condition_cfgs = cfg.get(CONDITIONS)
         if not isinstance(condition_cfgs, list):
             raise TypeError("Experiment `conditions` must be a list.")
 
-        self.condition_cfgs = []
-        for cfg in condition_cfgs:
-            self.condition_cfgs.append(ConditonConfiguration(cfg, init_from_gui))
-        self.validate()
+        self.condition_cfgs = [
+            ConditonConfiguration(
+                cond_cfg, init_from_gui, bypass_validators=bypass_validators
+            )
+            for cond_cfg in condition_cfgs
+        ]
+        # The nested configurations validated themselves when constructed.
+        if not bypass_validators:
+            self._validate_structure()
 
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
-        if len(self.condition_cfgs) == 0:
-            raise ValueError(
-                "At least 1 experimental condition must be " "present in an experiment."
-            )
-
-        condition_names = []
         for cfg in self.condition_cfgs:
             cfg.validate()
-            condition_names.append(cfg.store_cfg.name)
-
-        if len(set(condition_names)) != len(condition_names):
-            raise ValueError(
-                "Non-unique condition names in Experiment "
-                "[{}].".format(self.__class__.__name__)
-            )
+        self.store_cfg.validate()
+        return self._validate_structure()
 
-        selection_names = [
-            s_cfg.store_cfg.name
-            for c_cfg in self.condition_cfgs
-            for s_cfg in c_cfg.selection_cfgs
-        ]
-        if len(set(selection_names)) != len(selection_names):
+    def _validate_structure(self):
+        """
+        Checks across the condition configurations, which are assumed to be
+        valid themselves.
+        """
+        if len(self.condition_cfgs) == 0:
             raise ValueError(
-                "Non-unique selection names across conditions "
-                "[{}].".format(self.__class__.__name__)
+                "At least 1 experimental condition must be " "present in an experiment."
             )
 
-        self.store_cfg.validate()
+        # Condition and selection names are checked in one walk of the tree.
+        condition_names = set()
+        selection_names = set()
+        for c_cfg in self.condition_cfgs:
+            name = c_cfg.store_cfg.name
+            if name in condition_names:
+                raise ValueError(
+                    "Non-unique condition names in Experiment "
+                    f"[{self.__class__.__name__}]."
+                )
+            condition_names.add(name)
+            for s_cfg in c_cfg.selection_cfgs:
+                name = s_cfg.store_cfg.name
+                if name in selection_names:
+                    raise ValueError(
+                        "Non-unique selection names across conditions "
+                        f"[{self.__class__.__name__}]."
+                    )
+                selection_names.add(name)
         return self
 
 
@@ -1308,6 +1452,10 @@ class ConditonConfiguration(Configuration):
     init_from_gui : `bool`, Default `False`
         If `True`, relaxes some of the validation checks to allow the object
         to be built up from scratch.
+    bypass_validators : `bool`, Default `False`
+        Skip validating this configuration and the configurations nested in
+        it after they are parsed, e.g. when reloading a configuration that
+        has already been validated.
 
     Attributes
     ----------
@@ -1325,42 +1473,54 @@ class ConditonConfiguration(Configuration):
 
     """
 
-    def __init__(self, cfg, init_from_gui=False):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for condition configuration.")
+    __slots__ = ("init_from_gui", "store_cfg", "selection_cfgs")
 
-        if SELECTIONS not in cfg:
+    @_require_dict("condition configuration")
+    def __init__(self, cfg, init_from_gui=False, bypass_validators=False):
+        selection_cfgs = cfg.get(SELECTIONS, _MISSING)
+        if selection_cfgs is _MISSING:
             raise KeyError(
                 "Configuration is missing required config value "
-                "`{}` [{}]".format(SELECTIONS, self.__class__.__name__)
+                f"`{SELECTIONS}` [{self.__class__.__name__}]"
             )
-        self.selection_cfgs = []
         self.init_from_gui = init_from_gui
-        self.store_cfg = StoreConfiguration(cfg, has_scorer=False)
-        selection_cfgs = cfg.get(SELECTIONS)
+        self.store_cfg = StoreConfiguration(
+            cfg, has_scorer=False, bypass_validators=bypass_validators
+        )
         if not isinstance(selection_cfgs, list):
             raise TypeError("Condition `selections` must be a list.")
 
-        for cfg in selection_cfgs:
-            self.selection_cfgs.append(
-                SelectionConfiguration(
-                    cfg, has_scorer=False, init_from_gui=init_from_gui
-                )
+        self.selection_cfgs = [
+            SelectionConfiguration(
+                sel_cfg,
+                has_scorer=False,
+                init_from_gui=init_from_gui,
+                bypass_validators=bypass_validators,
             )
-        self.validate()
+            for sel_cfg in selection_cfgs
+        ]
+        # The nested configurations validated themselves when constructed.
+        if not bypass_validators:
+            self._validate_structure()
 
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
+        for cfg in self.selection_cfgs:
+            cfg.validate()
+        self.store_cfg.validate()
+        return self._validate_structure()
+
+    def _validate_structure(self):
+        """
+        Checks on the selection list, whose entries are assumed to be valid.
+        """
         if not self.init_from_gui:
             if len(self.selection_cfgs) == 0:
                 raise ValueError(
                     "At least 1 selection must be " "present in a condition."
                 )
-        for cfg in self.selection_cfgs:
-            cfg.validate()
-        self.store_cfg.validate()
         return self
 
 
@@ -1380,6 +1540,10 @@ class SelectionConfiguration(Configuration):
     init_from_gui : `bool`, Default `False`
         If `True`, relaxes some of the validation checks to allow the object
         to be built up from scratch.
+    bypass_validators : `bool`, Default `False`
+        Skip validating this configuration and the configurations nested in
+        it after they are parsed, e.g. when reloading a configuration that
+        has already been validated.
 
     Attributes
     ----------
@@ -1399,6 +1563,8 @@ class SelectionConfiguration(Configuration):
 
     """
 
+    __slots__ = ("init_from_gui", "store_cfg", "lib_cfgs", "timepoints")
+
     _lib_constructors = {
         "BarcodeSeqLib": BarcodeSeqLibConfiguration,
         "BcidSeqLib": BcidSeqLibConfiguration,
@@ -1407,20 +1573,22 @@ class SelectionConfiguration(Configuration):
         "BasicSeqLib": BasicSeqLibConfiguration,
     }
 
-    def __init__(self, cfg, has_scorer=True, init_from_gui=False):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for selection configuration.")
-
+    @_require_dict("selection configuration")
+    def __init__(
+        self, cfg, has_scorer=True, init_from_gui=False, bypass_validators=False
+    ):
         self.lib_cfgs = []
         self.timepoints = []
         self.init_from_gui = init_from_gui
         has_scorer = has_scorer and not init_from_gui
-        self.store_cfg = StoreConfiguration(cfg, has_scorer).validate()
+        self.store_cfg = StoreConfiguration(
+            cfg, has_scorer, bypass_validators=bypass_validators
+        )
 
-        if LIBRARIES not in cfg:
-            raise KeyError("Selection has no `{}` element.".format(LIBRARIES))
+        library_cfgs = cfg.get(LIBRARIES, _MISSING)
+        if library_cfgs is _MISSING:
+            raise KeyError(f"Selection has no `{LIBRARIES}` element.")
 
-        library_cfgs = cfg.get(LIBRARIES)
         if not isinstance(library_cfgs, list):
             raise TypeError("Selection library config must be a list.")
 
@@ -1429,28 +1597,42 @@ class SelectionConfiguration(Configuration):
             if library_type is None:
                 raise ValueError("Unrecognized SeqLib config")
             library_constructor = self._lib_constructors[library_type]
-            self.lib_cfgs.append(library_constructor(libraries_cfg))
-        self.validate()
+            self.lib_cfgs.append(
+                library_constructor(libraries_cfg, bypass_validators=bypass_validators)
+            )
+        # The nested configurations validated themselves when constructed.
+        if not bypass_validators:
+            self._validate_structure()
 
     def validate(self):
         """
         Validate all attributes. Overrides parent method.
         """
+        for lib_cfg in self.lib_cfgs:
+            lib_cfg.validate()
+        self.store_cfg.validate()
+        return self._validate_structure()
+
+    def _validate_structure(self):
+        """
+        Checks across the library configurations, such as timepoints and
+        names, assuming each library is valid itself.
+        """
         if not self.init_from_gui:
             if len(self.lib_cfgs) == 0:
                 raise ValueError(
                     "At least 1 library must be " "present in a selection."
                 )
 
-            self.timepoints = set([l.timepoint for l in self.lib_cfgs])
+            self.timepoints = {lib_cfg.timepoint for lib_cfg in self.lib_cfgs}
             if 0 not in self.timepoints:
                 raise ValueError(
-                    "Missing timepoint 0 [{}].".format(self.__class__.__name__)
+                    f"Missing timepoint 0 [{self.__class__.__name__}]."
                 )
 
             if len(self.timepoints) < 2:
                 raise ValueError(
-                    "Multiple timepoints required [{}].".format(self.__class__.__name__)
+                    f"Multiple timepoints required [{self.__class__.__name__}]."
                 )
 
             if self.store_cfg.has_scorer:
@@ -1459,20 +1641,15 @@ class SelectionConfiguration(Configuration):
                     raise ValueError(
                         "Insufficient number of timepoints for "
                         "regression scoring "
-                        "[{}].".format(self.__class__.__name__)
+                        f"[{self.__class__.__name__}]."
                     )
 
-        num_names = len(set([lib_cfg.store_cfg.name for lib_cfg in self.lib_cfgs]))
-        if num_names != len(self.lib_cfgs):
-            raise ValueError(
-                "Libraries must have unique names within a "
-                "selection [{}].".format(self.__class__.__name__)
-            )
-
-        for lib_cfg in self.lib_cfgs:
-            lib_cfg.validate()
-
-        self.store_cfg.validate()
+        _check_unique(
+            (lib_cfg.store_cfg.name for lib_cfg in self.lib_cfgs),
+            "Libraries must have unique names within a "
+            "selection [{}].",
+            self.__class__.__name__,
+        )
         return self
 
 
@@ -1489,6 +1666,9 @@ class StoreConfiguration(Configuration):
         The dictionary parsed from a configuration file.
     has_scorer : `bool`, Default `True`
         Indicates if the configuration should also look for a plugin.
+    bypass_validators : `bool`, Default `False`
+        Skip the validation normally run at the end of construction. Only
+        intended for configurations that are known to be valid.
         
     Attributes
     ----------
@@ -1513,19 +1693,30 @@ class StoreConfiguration(Configuration):
 
     """
 
-    def __init__(self, cfg, has_scorer=True):
-        if not isinstance(cfg, dict):
-            raise TypeError("dict required for store configuration.")
+    __slots__ = (
+        "scorer_cfg",
+        "name",
+        "output_dir",
+        "store_path",
+        "has_scorer",
+        "has_store_path",
+        "has_output_dir",
+    )
+
+    @_require_dict("store configuration")
+    def __init__(self, cfg, has_scorer=True, bypass_validators=False):
         if not isinstance(has_scorer, bool):
             raise TypeError("Boolean required for 'has_storer'.")
 
-        if has_scorer and SCORER not in cfg:
-            raise KeyError("Missing '{}' key from store configuration.".format(SCORER))
-        if NAME not in cfg:
-            raise KeyError("Missing '{}' key from store configuration.".format(NAME))
+        scorer_cfg = cfg.get(SCORER, _MISSING)
+        if has_scorer and scorer_cfg is _MISSING:
+            raise KeyError(f"Missing '{SCORER}' key from store configuration.")
+        name = cfg.get(NAME, _MISSING)
+        if name is _MISSING:
+            raise KeyError(f"Missing '{NAME}' key from store configuration.")
 
-        self.scorer_cfg = cfg.get(SCORER, {})
-        self.name = cfg.get(NAME)
+        self.scorer_cfg = {} if scorer_cfg is _MISSING else scorer_cfg
+        self.name = name
         self.output_dir = cfg.get(OUTPUT_DIR, "")
         self.store_path = cfg.get(STORE, "")
         self.has_scorer = has_scorer
@@ -1551,10 +1742,13 @@ class StoreConfiguration(Configuration):
         self.has_store_path = bool(self.store_path)
         self.has_output_dir = bool(self.output_dir)
         if self.has_scorer:
+            # The scorer always validates: it loads the plugin and applies
+            # the configured options over the plugin defaults.
             self.scorer_cfg = ScorerConfiguration(self.scorer_cfg)
         else:
             self.scorer_cfg = None
-        self.validate()
+        if not bypass_validators:
+            self.validate()
 
     def validate(self):
         """
@@ -1567,15 +1761,17 @@ class StoreConfiguration(Configuration):
             raise ValueError("Scorer config cannot be NoneType.")
 
         if self.has_store_path and not os.path.exists(self.store_path):
-            raise IOError('Specified store file "{}" not found'.format(self.store_path))
+            raise IOError(f'Specified store file "{self.store_path}" not found')
 
         elif (
             self.has_store_path
             and os.path.splitext(self.store_path)[-1].lower() != ".h5"
         ):
             raise IOError(
-                "Unrecognized store file extension for " '"{}"'.format(self.store_path)
+                f'Unrecognized store file extension for "{self.store_path}"'
             )
+        elif self.has_store_path:
+            _check_file_contents(self.store_path, "Store file", binary=True)
 
         if self.has_output_dir:
             if not os.path.exists(self.output_dir):
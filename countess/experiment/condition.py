@@ -50,8 +50,12 @@ class Condition(StoreManager):
     def __init__(self):
         StoreManager.__init__(self)
         self.selections = list()
+        self._sorted_selections = None
+        self._sorted_key = None
 
-    def configure(self, cfg, configure_children=True, init_from_gui=False):
+    def configure(
+        self, cfg, configure_children=True, init_from_gui=False, bypass_validators=False
+    ):
         """
         Set up the :py:class:`~enrich2.experiment.condition.Condition` 
         using the *cfg* object, usually from a ``.json`` configuration file.
@@ -64,12 +68,17 @@ class Condition(StoreManager):
             Traverse children and configure each one.
         init_from_gui : `bool` 
             Allow this instance to be configured from a GUI.
+        bypass_validators : `bool`
+            Skip validation when building the configuration object from a
+            `dict` that has already been validated.
 
         """
         from ..config.types import ConditonConfiguration
 
         if isinstance(cfg, dict):
-            cfg = ConditonConfiguration(cfg, init_from_gui)
+            cfg = ConditonConfiguration(
+                cfg, init_from_gui, bypass_validators=bypass_validators
+            )
         elif not isinstance(cfg, ConditonConfiguration):
             raise TypeError("`cfg` was neither a ConditonConfiguration or dict.")
 
@@ -112,18 +121,29 @@ class Condition(StoreManager):
         `list`
             List of sorted selection objects, sorted by name.
         """
-        return sorted(self.selections, key=lambda x: x.name)
+        # The order only changes when a selection is added, removed or
+        # renamed, so the sorted list is kept until one of those happens.
+        key = (
+            StoreManager._tree_version,
+            StoreManager._name_version,
+            len(self.selections),
+        )
+        if self._sorted_selections is None or self._sorted_key != key:
+            self._sorted_selections = sorted(self.selections, key=lambda x: x.name)
+            self._sorted_key = key
+        return list(self._sorted_selections)
 
     def add_child(self, child):
         """
         Add a :py:class:`~enrich2.selection.selection.Selection`
         """
-        if child.name in self.child_names():
+        if any(x.name == child.name for x in self.selections):
             raise ValueError(
                 "Non-unique selection " "name '{}' [{}]".format(child.name, self.name)
             )
         child.parent = self
         self.selections.append(child)
+        self._sorted_selections = None
 
     def remove_child_id(self, tree_id):
         """
@@ -132,3 +152,4 @@ class Condition(StoreManager):
         Treeview id *tree_id*.
         """
         self.selections = [x for x in self.selections if x.treeview_id != tree_id]
+        self._sorted_selections = None
@@ -15,9 +15,9 @@ import scipy.stats as stats
 
 from ..base.config_constants import SCORER, SCORER_OPTIONS, SCORER_PATH
 from ..base.config_constants import CONDITIONS
-from ..base.utils import compute_md5, log_message
+from ..base.utils import log_message
 
-from ..base.constants import WILD_TYPE_VARIANT
+from ..base.constants import WILD_TYPE_VARIANT, FILE_HASH_ALGORITHM
 from ..base.storemanager import StoreManager
 from ..statistics.random_effects import partitioned_rml_estimator
 from ..statistics.random_effects import nan_filter_generator
@@ -123,7 +123,9 @@ class Experiment(StoreManager):
             else:
                 return None
 
-    def configure(self, cfg, configure_children=True, init_from_gui=False):
+    def configure(
+        self, cfg, configure_children=True, init_from_gui=False, bypass_validators=False
+    ):
         """
         Set up the :py:class:`~enrich2.experiment.experiment.Experiment` 
         using the *cfg* object, usually from a ``.json`` configuration file.
@@ -136,12 +138,17 @@ class Experiment(StoreManager):
             Traverse children and configure each one.
         init_from_gui : `bool` 
             Allow this instance to be configured from a GUI.
+        bypass_validators : `bool`
+            Skip validation when building the configuration object from a
+            `dict` that has already been validated.
             
         """
         from ..config.types import ExperimentConfiguration
 
         if isinstance(cfg, dict):
-            cfg = ExperimentConfiguration(cfg, init_from_gui)
+            cfg = ExperimentConfiguration(
+                cfg, init_from_gui, bypass_validators=bypass_validators
+            )
         elif not isinstance(cfg, ExperimentConfiguration):
             raise TypeError("`cfg` was neither a " "ExperimentConfiguration or dict.")
 
@@ -173,7 +180,9 @@ class Experiment(StoreManager):
             cfg[SCORER] = {
                 SCORER_PATH: self.get_root().scorer_path,
                 SCORER_OPTIONS: self.get_root().scorer_class_attrs,
-                SCORER_PATH + " md5": compute_md5(self.get_root().scorer_path),
+                f"{SCORER_PATH} {FILE_HASH_ALGORITHM}": self.file_hash(
+                    self.get_root().scorer_path
+                ),
             }
         return cfg
 
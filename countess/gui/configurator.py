@@ -20,7 +20,7 @@ from tkinter.ttk import Frame, Button, Checkbutton, Treeview, LabelFrame
 from tkinter.messagebox import askyesno, showinfo, showwarning, askokcancel
 
 from ..base.config_constants import SCORER, SCORER_OPTIONS, SCORER_PATH
-from ..base.constants import CALLBACK, MESSAGE, KWARGS
+from ..base.constants import CALLBACK, MESSAGE, ARGS, KWARGS
 from ..base.utils import get_logging_queue, log_message
 from ..experiment.condition import Condition
 from ..selection.selection import Selection
@@ -890,14 +890,16 @@ class Configurator(tk.Tk):
 
     def poll_logging_queue(self):
         """
-        Polls the logging queue for messages to log.
+        Polls the logging queue and logs all messages waiting in it.
         """
-        try:
-            log = get_logging_queue(init=True).get(0)
-            log[CALLBACK](log[MESSAGE], **log[KWARGS])
-            self.after(10, self.poll_logging_queue)
-        except queue.Empty:
-            self.after(10, self.poll_logging_queue)
+        log_queue = get_logging_queue(init=True)
+        while log_queue:
+            try:
+                log = log_queue.popleft()
+            except IndexError:
+                break
+            log[CALLBACK](log[MESSAGE], *log[ARGS], **log[KWARGS])
+        self.after(10, self.poll_logging_queue)
 
     def poll_analysis_thread(self):
         """
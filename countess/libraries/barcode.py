@@ -12,7 +12,8 @@ import sys
 
 from ..sequence.fqread import read_fastq
 from .seqlib import SeqLib
-from ..base.utils import compute_md5, log_message
+from ..base.utils import log_message
+from ..base.constants import FILE_HASH_ALGORITHM
 
 
 __all__ = ["BarcodeSeqLib"]
@@ -127,6 +128,20 @@ class BarcodeSeqLib(SeqLib):
         cfg["fastq"] = self.serialize_fastq()
         return cfg
 
+    def input_files(self):
+        """
+        Adds the FASTQ_ reads file to the input files.
+
+        Returns
+        -------
+        `list`
+            List of file paths.
+        """
+        files = super().input_files()
+        if self.reads is not None:
+            files.append(self.reads)
+        return files
+
     def configure_fastq(self, cfg):
         """
         Set up the object's FASTQ_ file handling and filtering options.
@@ -155,7 +170,7 @@ class BarcodeSeqLib(SeqLib):
             "reads": self.reads,
             "reverse": self.revcomp_reads,
             "filters": self.serialize_filters(),
-            "reads md5": compute_md5(self.reads),
+            f"reads {FILE_HASH_ALGORITHM}": self.file_hash(self.reads),
         }
         if self.trim_start is not None and self.trim_start > 1:
             fastq["start"] = self.trim_start
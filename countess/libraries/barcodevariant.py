@@ -10,7 +10,8 @@ library containing variants which are also barcode sequences.
 import logging
 import pandas as pd
 
-from ..base.utils import compute_md5, log_message
+from ..base.utils import log_message
+from ..base.constants import FILE_HASH_ALGORITHM
 from ..libraries.barcodemap import BarcodeMap
 from .barcode import BarcodeSeqLib
 from .variant import VariantSeqLib
@@ -115,9 +116,25 @@ class BcvSeqLib(VariantSeqLib, BarcodeSeqLib):
         # required for creating new objects in GUI
         if self.barcode_map is not None:
             cfg["barcodes"]["map file"] = self.barcode_map.filename
-            cfg["barcodes"]["map file md5"] = compute_md5(self.barcode_map.filename)
+            cfg["barcodes"][f"map file {FILE_HASH_ALGORITHM}"] = self.file_hash(
+                self.barcode_map.filename
+            )
         return cfg
 
+    def input_files(self):
+        """
+        Adds the barcode map file to the input files.
+
+        Returns
+        -------
+        `list`
+            List of file paths.
+        """
+        files = super().input_files()
+        if self.barcode_map is not None:
+            files.append(self.barcode_map.filename)
+        return files
+
     def calculate(self):
         """
         Counts the barcodes using :py:meth:`BarcodeSeqLib.count`
@@ -12,7 +12,8 @@ import logging
 
 from ..sequence.fqread import read_fastq
 from .variant import VariantSeqLib
-from ..base.utils import compute_md5, log_message
+from ..base.utils import log_message
+from ..base.constants import FILE_HASH_ALGORITHM
 
 
 __all__ = ["BasicSeqLib"]
@@ -111,6 +112,20 @@ class BasicSeqLib(VariantSeqLib):
         cfg["fastq"] = self.serialize_fastq()
         return cfg
 
+    def input_files(self):
+        """
+        Adds the FASTQ_ reads file to the input files.
+
+        Returns
+        -------
+        `list`
+            List of file paths.
+        """
+        files = super().input_files()
+        if self.reads is not None:
+            files.append(self.reads)
+        return files
+
     def configure_fastq(self, cfg):
         """
         Set up the object's FASTQ_ file handling and filtering options.
@@ -137,7 +152,7 @@ class BasicSeqLib(VariantSeqLib):
         """
         fastq = dict(filters=self.serialize_filters())
         fastq["reads"] = self.reads
-        fastq["read md5"] = compute_md5(self.reads)
+        fastq[f"read {FILE_HASH_ALGORITHM}"] = self.file_hash(self.reads)
 
         if self.revcomp_reads:
             fastq["reverse"] = True
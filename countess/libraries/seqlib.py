@@ -15,8 +15,8 @@ import numpy as np
 import pandas as pd
 
 from ..base.storemanager import StoreManager
-from ..base.utils import fix_filename, compute_md5, log_message
-from ..base.constants import ELEMENT_LABELS
+from ..base.utils import fix_filename, log_message
+from ..base.constants import ELEMENT_LABELS, FILE_HASH_ALGORITHM
 from countess.store.hdf import HdfStore
 
 
@@ -224,9 +224,26 @@ class SeqLib(StoreManager):
         cfg["report filtered reads"] = self.report_filtered
         if self.counts_file is not None:
             cfg["counts file"] = self.counts_file
-            cfg["counts file md5"] = compute_md5(self.counts_file)
+            cfg[f"counts file {FILE_HASH_ALGORITHM}"] = self.file_hash(
+                self.counts_file
+            )
         return cfg
 
+    def input_files(self):
+        """
+        Adds the counts file, if any, to the input files of
+        :py:meth:`~StoreManager.input_files`.
+
+        Returns
+        -------
+        `list`
+            List of file paths.
+        """
+        files = super().input_files()
+        if self.counts_file is not None:
+            files.append(self.counts_file)
+        return files
+
     def calculate(self):
         """
         Pure virtual method that defines how the data are counted.
@@ -330,9 +347,10 @@ class SeqLib(StoreManager):
 
         self.map_table(source=raw_table, destination=main_table, source_query=query)
 
+        counts = self.get_table(main_table, columns=["count"])
         msg = "Counted {n} {label} ({u} unique) after query".format(
-            n=self.store[main_table]["count"].sum(),
-            u=len(self.store[main_table].index),
+            n=counts["count"].sum(),
+            u=len(counts.index),
             label=label,
         )
         log_message(logging_callback=logging.info, msg=msg, extra={"oname": self.name})
@@ -12,11 +12,11 @@ import re
 
 from ..base.constants import re_coding, re_noncoding, re_protein
 from .seqlib import SeqLib
-from ..base.constants import AA_CODES, CODON_TABLE, DEFAULT_MAX_MUTATIONS
+from ..base.constants import AA1_TO_3, AA3_TO_1, DEFAULT_MAX_MUTATIONS
 from ..base.constants import SYNONYMOUS_VARIANT, WILD_TYPE_VARIANT
 from ..sequence.aligner import Aligner
 from ..sequence.wildtype import WildTypeSequence
-from ..base.utils import log_message
+from ..base.utils import log_message, translate_dna
 
 
 __all__ = [
@@ -94,7 +94,7 @@ def hgvs2single(s):
     """
     _validate_str(s)
     t = re_protein.findall(s)
-    return ["{}{}{}".format(AA_CODES[m[1]], m[2], AA_CODES[m[3]]) for m in t]
+    return ["{}{}{}".format(AA3_TO_1[m[1]], m[2], AA3_TO_1[m[3]]) for m in t]
 
 
 def single2hgvs(s):
@@ -118,7 +118,7 @@ def single2hgvs(s):
     """
     _validate_str(s)
     t = re.findall("[A-Z*]\d+[A-Z*]", s)
-    return ["p.{}{}{}".format(AA_CODES[x[0]], x[1:-1], AA_CODES[x[-1]]) for x in t]
+    return ["p.{}{}{}".format(AA1_TO_3[x[0]], x[1:-1], AA1_TO_3[x[-1]]) for x in t]
 
 
 def get_variant_type(variant):
@@ -219,7 +219,7 @@ def has_unresolvable(variant):
         ``True`` if there is an unresolvable change, else ``False``
     """
     _validate_str(variant)
-    if AA_CODES["?"] in variant:
+    if AA1_TO_3["?"] in variant:
         return True
     else:
         return False
@@ -531,12 +531,8 @@ class VariantSeqLib(SeqLib):
 
         mutation_strings = list()
         if self.is_coding():
-            variant_protein = ""
-            for i in range(0, len(variant_dna), 3):
-                try:
-                    variant_protein += CODON_TABLE[variant_dna[i : i + 3]]
-                except KeyError:  # garbage codon due to indel, X, or N
-                    variant_protein += "?"
+            # garbage codons due to indel, X, or N are translated as "?"
+            variant_protein = translate_dna(variant_dna)
 
             for pos, change in mutations:
                 ref_dna_pos = pos + self.wt.dna_offset + 1
@@ -544,15 +540,15 @@ class VariantSeqLib(SeqLib):
                 mut = "c.{pos}{change}".format(pos=ref_dna_pos, change=change)
                 if has_indel(change):
                     mut += " (p.{pre}{pos}fs)".format(
-                        pre=AA_CODES[self.wt.protein_seq[pos // 3]], pos=ref_pro_pos
+                        pre=AA1_TO_3[self.wt.protein_seq[pos // 3]], pos=ref_pro_pos
                     )
                 elif variant_protein[pos // 3] == self.wt.protein_seq[pos // 3]:
                     mut += " (p.=)"
                 else:
                     mut += " (p.{pre}{pos}{post})".format(
-                        pre=AA_CODES[self.wt.protein_seq[pos // 3]],
+                        pre=AA1_TO_3[self.wt.protein_seq[pos // 3]],
                         pos=ref_pro_pos,
-                        post=AA_CODES[variant_protein[pos // 3]],
+                        post=AA1_TO_3[variant_protein[pos // 3]],
                     )
                 mutation_strings.append(mut)
         else:
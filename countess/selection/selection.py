@@ -12,8 +12,8 @@ import numpy as np
 import pandas as pd
 import scipy.stats as stats
 
-from ..base.constants import WILD_TYPE_VARIANT
-from ..base.utils import compute_md5, log_message
+from ..base.constants import WILD_TYPE_VARIANT, FILE_HASH_ALGORITHM
+from ..base.utils import log_message
 from ..base.storemanager import StoreManager
 from ..base.config_constants import SCORER, SCORER_OPTIONS, SCORER_PATH
 from ..base.config_constants import LIBRARIES
@@ -181,13 +181,16 @@ class Selection(StoreManager):
             else:
                 return None
 
-    def configure(self, cfg, configure_children=True, init_from_gui=False):
+    def configure(
+        self, cfg, configure_children=True, init_from_gui=False, bypass_validators=False
+    ):
         """
         Set up the :py:class:`~enrich2.selection.selection.Selection` 
         using the *cfg* object, usually from a ``.json`` configuration file.
 
         If *configure_children* is false, do not configure the children in 
-        *cfg*.
+        *cfg*. If *bypass_validators* is true, a *cfg* `dict` is parsed
+        without being validated.
         """
         from ..config.types import SelectionConfiguration
 
@@ -195,7 +198,9 @@ class Selection(StoreManager):
             has_scorer = True
             if init_from_gui:
                 has_scorer = False
-            cfg = SelectionConfiguration(cfg, has_scorer, init_from_gui)
+            cfg = SelectionConfiguration(
+                cfg, has_scorer, init_from_gui, bypass_validators=bypass_validators
+            )
         elif not isinstance(cfg, SelectionConfiguration):
             raise TypeError("`cfg` was neither a " "SelectionConfiguration or dict.")
 
@@ -279,7 +284,9 @@ class Selection(StoreManager):
         cfg[SCORER] = {
             SCORER_PATH: self.get_root().scorer_path,
             SCORER_OPTIONS: self.get_root().scorer_class_attrs,
-            SCORER_PATH + " md5": compute_md5(self.get_root().scorer_path),
+            f"{SCORER_PATH} {FILE_HASH_ALGORITHM}": self.file_hash(
+                self.get_root().scorer_path
+            ),
         }
         return cfg
 
@@ -590,8 +597,8 @@ class Selection(StoreManager):
         scores_key = "/main/{}/scores".format(label)
         counts_key = "/main/{}/counts".format(label)
         if self.table_exists_for_key(scores_key):
-            scores_index = self.get_table(scores_key).index
-            counts_index = self.get_table(counts_key).index
+            scores_index = self.get_index(scores_key)
+            counts_index = self.get_index(counts_key)
             return scores_index.equals(counts_index)
         else:
             raise ValueError(
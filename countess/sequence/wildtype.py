@@ -9,8 +9,7 @@ reference sequence.
 import logging
 import re
 
-from ..base.constants import CODON_TABLE
-from ..base.utils import log_message
+from ..base.utils import log_message, translate_dna
 
 
 __all__ = ["WildTypeSequence"]
@@ -128,9 +127,7 @@ class WildTypeSequence(object):
                 )
 
             # perform translation
-            self.protein_seq = ""
-            for i in range(0, len(self.dna_seq), 3):
-                self.protein_seq += CODON_TABLE[self.dna_seq[i : i + 3]]
+            self.protein_seq = translate_dna(self.dna_seq)
 
             # set the reference offset if it's a multiple of three
             if self.dna_offset % 3 == 0:
@@ -18,7 +18,8 @@
 import pandas as pd
 import dask.dataframe as dd
 import numpy as np
-from typing import Union, Sequence, Mapping, Any, Dict
+from typing import Union, Sequence, Mapping, Any, Dict, Optional, Iterator, Tuple
+from typing import List
 from os import PathLike
 from countess.store.interface import StoreInterface
 
@@ -37,6 +38,12 @@ class HdfStore(StoreInterface):
     ----------
     path: str
         Path to a new or existing HDF5 file.
+    complib: Optional[str]
+        Compression library used when writing tables, for example
+        "blosc:lz4". Default None (no compression).
+    complevel: int
+        Compression level from 0 to 9 used when writing tables. Default 0
+        (no compression).
 
     Attributes
     ----------
@@ -49,8 +56,15 @@ class HdfStore(StoreInterface):
     file_extensions = (".h5",)
     metadata_key = "countESS"
 
-    def __init__(self, path: Union[PathLike, str]) -> None:
+    def __init__(
+        self,
+        path: Union[PathLike, str],
+        complib: Optional[str] = None,
+        complevel: int = 0,
+    ) -> None:
         super().__init__(path)
+        self.complib = complib
+        self.complevel = complevel
 
         if self.path.is_file():
             with pd.HDFStore(str(self.path)) as store:
@@ -58,6 +72,17 @@ class HdfStore(StoreInterface):
                 file_keys = [k[1:] if k.startswith("/") else k for k in store.keys()]
                 self._keys.extend(file_keys)
 
+    @staticmethod
+    def _key(key: str) -> str:
+        """
+        Returns key without its leading "/", which is how keys are tracked
+        for tables loaded from an existing file.
+        """
+        return key.lstrip("/")
+
+    def __contains__(self, key: str) -> bool:
+        return self._key(key) in self._keys
+
     def put(self, key: str, value: dd.DataFrame) -> None:
         """
         Stores a data frame in the HDF file under the given key.
@@ -70,9 +95,16 @@ class HdfStore(StoreInterface):
             The Dask data frame to store.
 
         """
+        key = self._key(key)
         if key not in self.keys():
             self._keys.append(key)
-        value.to_hdf(self.path, key, format="table")
+        value.to_hdf(
+            self.path,
+            key,
+            format="table",
+            complib=self.complib,
+            complevel=self.complevel,
+        )
 
     def drop(self, key: str) -> None:
         """
@@ -92,6 +124,7 @@ class HdfStore(StoreInterface):
             If the key is not in the store.
 
         """
+        key = self._key(key)
         if key not in self.keys():
             raise KeyError(f"{self.__class__.__name__} does not contain key '{key}'")
         else:
@@ -119,6 +152,7 @@ class HdfStore(StoreInterface):
             If the key is not in the store.
 
         """
+        key = self._key(key)
         if key not in self.keys():
             raise KeyError(f"{self.__class__.__name__} does not contain key '{key}'")
         else:
@@ -127,6 +161,7 @@ class HdfStore(StoreInterface):
     def get_column(self, key: str, column: str) -> np.ndarray:
         """
         Returns the values of a single column of the data frame stored under key.
+        The column "index" returns the values of the index.
 
         Parameters
         ----------
@@ -146,8 +181,12 @@ class HdfStore(StoreInterface):
             If the key is not in the store.
 
         """
+        key = self._key(key)
         if key not in self.keys():
             raise KeyError(f"{self.__class__.__name__} does not contain key '{key}'")
+        elif column == "index":
+            with pd.HDFStore(self.path, mode="r") as store:
+                return store.select_column(key, "index").values
         else:
             return (
                 dd.read_hdf(self.path, key, columns=[column]).compute().values.flatten()
@@ -183,11 +222,7 @@ class HdfStore(StoreInterface):
             If the resulting data frame is empty (no shared index values).
 
         """
-        for key in keys:
-            if key not in self.keys():
-                raise KeyError(
-                    f"{self.__class__.__name__} does not contain key '{key}'"
-                )
+        keys = self._check_keys(keys)
         result = None
         for key in keys:
             if result is None:
@@ -200,6 +235,221 @@ class HdfStore(StoreInterface):
             raise ValueError(f"{self.__class__.__name__} merge result is empty")
         return result
 
+    def _check_keys(self, keys: Sequence[str]) -> List[str]:
+        """
+        Returns the normalized keys, raising a KeyError for the first one that
+        is not in the store.
+        """
+        keys = [self._key(key) for key in keys]
+        for key in keys:
+            if key not in self.keys():
+                raise KeyError(
+                    f"{self.__class__.__name__} does not contain key '{key}'"
+                )
+        return keys
+
+    def select(
+        self,
+        key: str,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[Any] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns the rows of the data frame stored under key as a pandas
+        DataFrame, reading only what is requested.
+
+        Parameters
+        ----------
+        key: str
+            The key to access.
+        columns: Optional[Sequence[str]]
+            Columns to read. Default None (all columns).
+        where: Optional[Any]
+            Query string or row coordinates selecting the rows to read.
+            Default None (all rows).
+        start: Optional[int]
+            First row to read. Default None.
+        stop: Optional[int]
+            Row to stop reading before. Default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            The selected rows.
+
+        Raises
+        ------
+        KeyError
+            If the key is not in the store.
+
+        """
+        (key,) = self._check_keys([key])
+        with pd.HDFStore(self.path, mode="r") as store:
+            return store.select(
+                key, where=where, columns=columns, start=start, stop=stop
+            )
+
+    def select_as_multiple(
+        self,
+        keys: Sequence[str],
+        selector: str,
+        where: Optional[Any] = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns the same rows of several data frames that share an index,
+        joined column-wise into one pandas DataFrame.
+
+        Parameters
+        ----------
+        keys: Sequence[str]
+            The keys to access.
+        selector: str
+            The key whose rows *where*, *start* and *stop* refer to.
+        where: Optional[Any]
+            Query string or row coordinates selecting the rows to read.
+            Default None (all rows).
+        start: Optional[int]
+            First row to read. Default None.
+        stop: Optional[int]
+            Row to stop reading before. Default None.
+
+        Returns
+        -------
+        pd.DataFrame
+            The selected rows.
+
+        Raises
+        ------
+        KeyError
+            If any key is not in the store.
+
+        """
+        keys = self._check_keys(keys)
+        (selector,) = self._check_keys([selector])
+        with pd.HDFStore(self.path, mode="r") as store:
+            return store.select_as_multiple(
+                keys, where=where, selector=selector, start=start, stop=stop
+            )
+
+    def select_as_coordinates(self, key: str, where: Any) -> pd.Index:
+        """
+        Returns the row coordinates of the data frame stored under key that
+        match the query *where*.
+
+        Parameters
+        ----------
+        key: str
+            The key to access.
+        where: Any
+            Query string selecting the rows.
+
+        Returns
+        -------
+        pd.Index
+            The matching row numbers.
+
+        Raises
+        ------
+        KeyError
+            If the key is not in the store.
+
+        """
+        (key,) = self._check_keys([key])
+        with pd.HDFStore(self.path, mode="r") as store:
+            return store.select_as_coordinates(key, where)
+
+    def append(self, key: str, value: pd.DataFrame, **kwargs: Any) -> None:
+        """
+        Appends the rows of a pandas DataFrame to the table stored under key,
+        creating the table if it does not exist.
+
+        The store's compression settings are used unless *kwargs* sets
+        complib or complevel. Other keyword arguments, such as min_itemsize,
+        data_columns or expectedrows, are passed on to
+        :py:meth:`pandas.HDFStore.append`.
+
+        Parameters
+        ----------
+        key: str
+            Name of the data frame in the store.
+        value: pd.DataFrame
+            The rows to append.
+
+        """
+        key = self._key(key)
+        kwargs.setdefault("complib", self.complib)
+        kwargs.setdefault("complevel", self.complevel)
+        with pd.HDFStore(self.path) as store:
+            store.append(key, value, format="table", **kwargs)
+        if key not in self.keys():
+            self._keys.append(key)
+
+    def table_info(self, key: str, attrs: Sequence[str] = ()) -> Dict[str, Any]:
+        """
+        Returns the layout of the table stored under key, opening the file
+        once.
+
+        Parameters
+        ----------
+        key: str
+            The key to access.
+        attrs: Sequence[str]
+            Names of table attributes to return, as set with
+            :py:meth:`set_table_attr`. Default () (none).
+
+        Returns
+        -------
+        Dict[str, Any]
+            "nrows" is the number of rows and "rowsize" the size of a row in
+            bytes, or None if unknown. Each name in *attrs* maps to its value,
+            or None if it is not set.
+
+        Raises
+        ------
+        KeyError
+            If the key is not in the store.
+
+        """
+        (key,) = self._check_keys([key])
+        with pd.HDFStore(self.path, mode="r") as store:
+            storer = store.get_storer(key)
+            table = getattr(storer, "table", None)
+            info = {
+                "nrows": storer.nrows,
+                "rowsize": None if table is None else table.rowsize,
+            }
+            for name in attrs:
+                info[name] = getattr(storer.attrs, name, None)
+        return info
+
+    def set_table_attr(self, key: str, name: str, value: Any) -> None:
+        """
+        Sets a single attribute on the table stored under key, next to but
+        separate from its metadata.
+
+        Parameters
+        ----------
+        key: str
+            The key to access.
+        name: str
+            Name of the attribute.
+        value: Any
+            The value to store.
+
+        Raises
+        ------
+        KeyError
+            If the key is not in the store.
+
+        """
+        (key,) = self._check_keys([key])
+        with pd.HDFStore(self.path) as store:
+            setattr(store.get_storer(key).attrs, name, value)
+
     def set_metadata(
         self, key: str, metadata: Dict[str, Any], update: bool = False
     ) -> None:
@@ -224,6 +474,7 @@ class HdfStore(StoreInterface):
             If the metadata is not a Mapping.
 
         """
+        key = self._key(key)
         if key not in self.keys():
             raise KeyError(f"{self.__class__.__name__} does not contain key '{key}'")
         if not isinstance(metadata, Mapping):
@@ -255,18 +506,99 @@ class HdfStore(StoreInterface):
             If the key is not in the store.
 
         """
+        key = self._key(key)
         if key not in self.keys():
             raise KeyError(f"{self.__class__.__name__} does not contain key '{key}'")
 
         with pd.HDFStore(self.path) as store:
-            try:
-                metadata = store.get_storer(key).attrs[self.metadata_key]
-            except KeyError as e:
-                if str(e).startswith(
-                    f"\"Attribute ('{self.metadata_key}') does not exist in node"
-                ):
-                    metadata = {}
-                else:
-                    # not sure what other KeyErrors could be raised
-                    raise e  # pragma: no cover
+            return self._read_metadata(store, key)
+
+    def iter_metadata(
+        self, keys: Optional[Sequence[str]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yields the metadata of several data frames, opening the file once.
+
+        Parameters
+        ----------
+        keys: Optional[Sequence[str]]
+            The keys to access. Default None (all keys).
+
+        Yields
+        ------
+        Tuple[str, Dict[str, Any]]
+            The key and its metadata.
+
+        Raises
+        ------
+        KeyError
+            If any key is not in the store.
+
+        """
+        if keys is None:
+            keys = self.keys()
+        keys = self._check_keys(keys)
+        if len(keys) == 0:
+            return
+
+        with pd.HDFStore(self.path, mode="r") as store:
+            for key in keys:
+                yield key, self._read_metadata(store, key)
+
+    def _read_metadata(self, store: pd.HDFStore, key: str) -> Dict[str, Any]:
+        """
+        Returns the metadata of the data frame located at key in an open
+        :py:class:`~pandas.HDFStore`, or an empty dictionary if it has none.
+        """
+        try:
+            metadata = store.get_storer(key).attrs[self.metadata_key]
+        except KeyError as e:
+            if str(e).startswith(
+                f"\"Attribute ('{self.metadata_key}') does not exist in node"
+            ):
+                metadata = {}
+            else:
+                # not sure what other KeyErrors could be raised
+                raise e  # pragma: no cover
         return metadata
+
+    def set_file_metadata(self, metadata: Dict[str, Any]) -> None:
+        """
+        Sets metadata on the HDF5 file itself rather than on one data frame.
+
+        The metadata is stored as an attribute of the root group, so it does
+        not appear as a key in the store.
+
+        Parameters
+        ----------
+        metadata : Dict[str, Any]
+            The metadata to store.
+
+        Raises
+        ------
+        TypeError
+            If the metadata is not a Mapping.
+
+        """
+        if not isinstance(metadata, Mapping):
+            raise TypeError(f"{self.__class__.__name__} must be a Mapping")
+
+        with pd.HDFStore(self.path) as store:
+            store.root._v_attrs[self.metadata_key] = metadata
+
+    def get_file_metadata(self) -> Dict[str, Any]:
+        """
+        Returns the metadata set on the HDF5 file itself. Returns an empty
+        dictionary if the file does not exist or has no metadata.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The metadata.
+
+        """
+        if not self.path.is_file():
+            return {}
+
+        with pd.HDFStore(self.path, mode="r") as store:
+            return getattr(store.root._v_attrs, self.metadata_key, {})
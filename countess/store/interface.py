@@ -50,6 +50,9 @@ class StoreInterface(metaclass=ABCMeta):
     def keys(self) -> List[str]:
         return self._keys
 
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
     def is_empty(self) -> bool:
         return len(self.keys()) == 0
 
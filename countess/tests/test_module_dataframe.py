@@ -1,14 +1,34 @@
 import unittest
+import numpy as np
 import pandas as pd
 
 from ..base.dataframe import fill_position_gaps, singleton_dataframe
 from ..base.dataframe import single_mutations_to_tuples
 from ..base.dataframe import single_mutation_index, filter_coding_index
-from ..base.dataframe import SingleMut
+from ..base.dataframe import SingleMut, validate_index
 from ..sequence.wildtype import WildTypeSequence
 
 
 class TestUtilitiesDataframe(unittest.TestCase):
+    def test_validate_index(self):
+        index = pd.Index(["ACGT", "ACGN", "TTTT"])
+        for element in ("barcodes", "identifiers", "variants", "synonymous"):
+            mask = validate_index(index, element)
+            self.assertIsInstance(mask, np.ndarray)
+            self.assertEqual(mask.dtype, bool)
+        self.assertListEqual(
+            list(validate_index(index, "barcodes")), [True, False, True]
+        )
+        self.assertListEqual(
+            list(validate_index(pd.Index(["a", ""]), "identifiers")), [True, False]
+        )
+        self.assertListEqual(
+            list(validate_index(index, "variants")), [True, True, True]
+        )
+        self.assertEqual(len(validate_index(pd.Index([]), "barcodes")), 0)
+        with self.assertRaises(ValueError):
+            validate_index(index, "counts")
+
     def test_single_mutation_index(self):
         # test cases use all() because testing equality of indices returns a vector of booleans
 
@@ -278,6 +298,20 @@ class TestUtilitiesDataframe(unittest.TestCase):
             )
             singleton_dataframe(values, wt, coding=False, plot_wt_score=False)
 
+    def test_singleton_dataframe_rejects_strings(self):
+        cfg = {
+            "coding": False,
+            "reference offset": 0,
+            "sequence": "AAAAAAAAAAAAAAAAAAAAA",
+        }
+        wt = WildTypeSequence("tests")
+        wt.configure(cfg)
+        index = ["c.1A>G (p.Ile1Leu)", "c.3A>T (p.Ile3Leu)", "_wt"]
+        for value in ("1.5", b"1.5", np.str_("1.5"), np.bytes_(b"1.5")):
+            values = pd.Series(data=[1.0, value, 2.0], index=index, dtype=object)
+            with self.assertRaises(ValueError):
+                singleton_dataframe(values, wt, coding=False, plot_wt_score=False)
+
     def test_singleton_dataframe_noncoding(self):
         cfg = {
             "coding": False,
@@ -0,0 +1,265 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import dask.dataframe as dd
+import pandas as pd
+
+from ..base.storemanager import StoreManager
+from ..base.utils import compute_file_hash
+from ..store.hdf import HdfStore
+
+
+class StoreManagerStub(StoreManager):
+    store_suffix = "stub"
+
+    def _children(self):
+        return []
+
+    def validate(self):
+        pass
+
+
+class TestStoreManagerStoreIO(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.obj = StoreManagerStub()
+        self.obj.name = "stub"
+        self.obj.output_dir = self._temp_dir.name
+        self.obj.force_recalculate = False
+        self.data = pd.DataFrame(
+            {"count": [1, 2, 3]}, index=pd.Index(["AAA", "AAC", "AAG"], name="index")
+        )
+
+    def tearDown(self):
+        if self.obj.store is not None:
+            self.obj.store_close()
+        self._temp_dir.cleanup()
+
+    def table_filters(self, key):
+        with pd.HDFStore(self.obj.store_path, mode="r") as store:
+            return store.get_storer(key).table.filters
+
+    def test_store_open_and_close(self):
+        self.obj.store_open()
+        self.assertEqual(
+            self.obj.store_path,
+            os.path.join(self._temp_dir.name, "stub_stub.h5"),
+        )
+        with self.assertRaises(ValueError):
+            self.obj.store_open()
+        self.obj.store.put("counts", dd.from_pandas(self.data, npartitions=1))
+        self.obj.store_close()
+        self.assertIsNone(self.obj.store)
+        self.assertTrue(os.path.isfile(self.obj.store_path))
+
+    def test_store_open_compressed(self):
+        self.obj.store_open()
+        self.assertEqual(self.obj.store.complib, StoreManager.compression_lib)
+        self.assertEqual(self.obj.store.complevel, StoreManager.compression_level)
+        self.obj.store.put("counts", dd.from_pandas(self.data, npartitions=1))
+        filters = self.table_filters("counts")
+        self.assertEqual(filters.complib, StoreManager.compression_lib)
+        self.assertEqual(filters.complevel, StoreManager.compression_level)
+
+    def test_store_open_uncompressed(self):
+        self.obj.compression = False
+        self.obj.store_open()
+        self.assertIsNone(self.obj.store.complib)
+        self.assertEqual(self.obj.store.complevel, 0)
+        self.obj.store.put("counts", dd.from_pandas(self.data, npartitions=1))
+        self.assertEqual(self.table_filters("counts").complevel, 0)
+
+    def test_reopen_matching_store_uses_cfg_hash(self):
+        self.obj.store_open()
+        self.obj.store.put("/raw/counts", dd.from_pandas(self.data, npartitions=1))
+        self.obj.store_close()
+        self.assertEqual(
+            HdfStore(self.obj.store_path).get_file_metadata(),
+            {"cfg_hash": self.obj.metadata_hash()},
+        )
+
+        with mock.patch.object(HdfStore, "iter_metadata") as iter_metadata:
+            self.obj.store_open()
+        iter_metadata.assert_not_called()
+        self.assertFalse(self.obj.override_filter_stats)
+        self.assertIn("/raw/counts", self.obj.store)
+        pd.testing.assert_frame_equal(self.obj.get_table("/raw/counts"), self.data)
+        self.assertListEqual(
+            list(self.obj.get_index("/raw/counts")), list(self.data.index)
+        )
+
+    def test_reopen_checks_tables_without_cfg_hash(self):
+        self.obj.store_open()
+        self.obj.store.put("/raw/counts", dd.from_pandas(self.data, npartitions=1))
+        self.obj.store_close()
+        HdfStore(self.obj.store_path).set_file_metadata({})
+
+        self.obj.store_open()
+        self.assertFalse(self.obj.override_filter_stats)
+        self.assertIn("/raw/counts", self.obj.store)
+
+    def test_reopen_mismatched_store_is_cleared(self):
+        self.obj.store_open()
+        self.obj.store.put("/raw/counts", dd.from_pandas(self.data, npartitions=1))
+        self.obj.store_close()
+        store = HdfStore(self.obj.store_path)
+        store.set_file_metadata({"cfg_hash": "0"})
+        store.set_metadata("/raw/counts", {"cfg": {"name": "other"}})
+
+        self.obj.store_open()
+        self.assertTrue(self.obj.override_filter_stats)
+        self.assertTrue(self.obj.store.is_empty())
+
+    def test_unclosed_store_is_checked_on_reopen(self):
+        self.obj.store_open()
+        self.obj.store.put("/raw/counts", dd.from_pandas(self.data, npartitions=1))
+        self.obj.store_close()
+
+        # a run with another configuration replaces the table, then stops
+        # before store_close
+        self.obj.store_open()
+        self.assertDictEqual(HdfStore(self.obj.store_path).get_file_metadata(), {})
+        self.obj.store.drop("/raw/counts")
+        self.obj.store.put(
+            "/raw/counts", dd.from_pandas(self.data * 100, npartitions=1)
+        )
+        self.obj.store.set_metadata("/raw/counts", {"cfg": {"name": "other"}})
+        self.obj.store = None
+
+        self.obj.store_open()
+        self.assertTrue(self.obj.store.is_empty())
+
+    def test_file_hash_not_cached_between_calls(self):
+        path = os.path.join(self._temp_dir.name, "input.txt")
+        with open(path, "wb") as fp:
+            fp.write(b"AAAA")
+        stat = os.stat(path)
+        first = self.obj.file_hash(path)
+        self.assertEqual(first, compute_file_hash(path))
+
+        # same size and modification time, different content
+        with open(path, "wb") as fp:
+            fp.write(b"CCCC")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertNotEqual(self.obj.file_hash(path), first)
+
+    def test_file_hash_reuses_digests_within_store_open(self):
+        path = os.path.join(self._temp_dir.name, "input.txt")
+        with open(path, "wb") as fp:
+            fp.write(b"AAAA")
+        self.obj.store_open()
+        self.obj.store.put("counts", dd.from_pandas(self.data, npartitions=1))
+        self.obj.store_close()
+
+        digests = []
+        with mock.patch.object(
+            StoreManagerStub, "input_files", return_value=[path]
+        ), mock.patch.object(
+            StoreManagerStub,
+            "serialize",
+            lambda obj: {"input": digests.append(obj.file_hash(path))},
+        ), mock.patch(
+            "countess.base.storemanager.compute_file_hash"
+        ) as compute:
+            self.obj.store_open()
+        compute.assert_not_called()
+        self.assertListEqual(digests, [compute_file_hash(path)])
+        self.assertIsNone(self.obj._file_hashes)
+
+
+def double_counts(df, factor=2):
+    return df.assign(count=df["count"] * factor)
+
+
+class TestStoreManagerMapTable(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.obj = StoreManagerStub()
+        self.obj.name = "stub"
+        self.obj.output_dir = self._temp_dir.name
+        self.obj.force_recalculate = False
+        self.obj.store_open()
+        self.data = pd.DataFrame(
+            {"count": [1, 2, 3, 4]},
+            index=pd.Index(["AAA", "AAC", "AAG", "AAT"], name="index"),
+        )
+        self.obj.store.append("/raw/counts", self.data, data_columns=["count"])
+
+    def tearDown(self):
+        self.obj.store_close()
+        self._temp_dir.cleanup()
+
+    def test_column_callback(self):
+        self.obj.map_table(
+            source="/raw/counts",
+            destination="/main/counts",
+            column_callback=double_counts,
+            row_callback_args=(3,),
+        )
+        pd.testing.assert_frame_equal(
+            self.obj.get_table("/main/counts"), double_counts(self.data, 3)
+        )
+        info = self.obj.store.table_info("/main/counts", attrs=("max_index_len",))
+        self.assertEqual(info["max_index_len"], 3)
+
+    def test_column_callback_longer_index(self):
+        def prefix_index(df):
+            return df.set_axis("p." + df.index, axis="index")
+
+        self.obj.map_table(
+            source="/raw/counts",
+            destination="/main/counts",
+            column_callback=prefix_index,
+        )
+        pd.testing.assert_frame_equal(
+            self.obj.get_table("/main/counts"),
+            prefix_index(self.data),
+            check_index_type=False,
+        )
+        info = self.obj.store.table_info("/main/counts", attrs=("max_index_len",))
+        self.assertEqual(info["max_index_len"], 5)
+
+    def test_column_callback_with_query(self):
+        self.obj.map_table(
+            source="/raw/counts",
+            destination="/main/counts",
+            source_query="count > 2",
+            column_callback=double_counts,
+        )
+        pd.testing.assert_frame_equal(
+            self.obj.get_table("/main/counts"), double_counts(self.data.iloc[2:])
+        )
+
+    def test_column_callback_preferred_over_row_callback(self):
+        row_callback = mock.Mock(side_effect=lambda row: row * 10)
+        self.obj.map_table(
+            source="/raw/counts",
+            destination="/main/counts",
+            row_callback=row_callback,
+            column_callback=double_counts,
+        )
+        row_callback.assert_not_called()
+        pd.testing.assert_frame_equal(
+            self.obj.get_table("/main/counts"), double_counts(self.data)
+        )
+
+    def test_row_callback_and_overwrite(self):
+        self.obj.map_table(
+            source="/raw/counts",
+            destination="/main/counts",
+            column_callback=double_counts,
+        )
+        self.obj.map_table(
+            source="/raw/counts",
+            destination="/main/counts",
+            row_callback=lambda row: row * 10,
+        )
+        pd.testing.assert_frame_equal(
+            self.obj.get_table("/main/counts"), self.data * 10
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -114,6 +114,20 @@ class ScorerConfigTest(TestCase):
         scorer_cfg = ScorerConfiguration(cfg).validate()
         self.assertTrue(scorer_cfg.scorer_class.name, "Regression")
 
+    def test_plugin_loaded_once_per_path(self):
+        from ..config.types import _cached_load_scorer
+
+        _cached_load_scorer.cache_clear()
+        path = os.path.join(self.plugin_dir, "regression_scorer.py")
+        cfg_1 = ScorerConfiguration(
+            {SCORER_PATH: path, SCORER_OPTIONS: {"logr_method": "complete"}}
+        )
+        cfg_2 = ScorerConfiguration({SCORER_PATH: path, SCORER_OPTIONS: {}})
+        self.assertEqual(_cached_load_scorer.cache_info().misses, 1)
+        self.assertIs(cfg_1.scorer_class, cfg_2.scorer_class)
+        self.assertEqual(cfg_1.scorer_class_attrs["logr_method"], "complete")
+        self.assertEqual(cfg_2.scorer_class_attrs["logr_method"], "wt")
+
     def test_empty_options_dict_defaults_correct(self):
         cfg = {
             SCORER_PATH: os.path.join(self.plugin_dir, "regression_scorer.py"),
@@ -277,6 +291,14 @@ class FiltersConfigTest(TestCase):
         with self.assertRaises(TypeError):
             FiltersConfiguration(cfg).validate()
 
+    def test_to_dict_rebuilt_after_change(self):
+        filters_cfg = FiltersConfiguration({FILTERS_MAX_N: 2})
+        result = filters_cfg.to_dict()
+        self.assertIs(filters_cfg.to_dict(), result)
+        filters_cfg.max_n = 5
+        self.assertEqual(result[FILTERS_MAX_N], 2)
+        self.assertEqual(filters_cfg.to_dict()[FILTERS_MAX_N], 5)
+
 
 class BarcodeConfigTest(TestCase):
     def setUp(self):
@@ -319,6 +341,17 @@ class BarcodeConfigTest(TestCase):
         with self.assertRaises(IOError):
             BarcodeConfiguration(cfg).validate()
 
+    def test_error_mapfile_removed_after_construction(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            map_file = os.path.join(tmp, "map.txt")
+            open(map_file, "w").close()
+            barcode_cfg = BarcodeConfiguration({BARCODE_MAP_FILE: map_file})
+            os.remove(map_file)
+            with self.assertRaises(IOError):
+                barcode_cfg.validate()
+
     def test_error_mapfile_not_str(self):
         cfg = {BARCODE_MAP_FILE: b"file"}
         with self.assertRaises(TypeError):
@@ -382,6 +415,10 @@ class VariantsConfigTest(TestCase):
         self.assertEqual(v_cfg.wildtype_cfg.sequence, "AAAAAA")
         self.assertEqual(v_cfg.wildtype_cfg.reference_offset, 0)
 
+    def test_repr_matches_rdict(self):
+        v_cfg = VariantsConfiguration({WILDTYPE: self.wt_cfg})
+        self.assertEqual(repr(v_cfg), str(v_cfg.__rdict__()))
+
     def test_override_defaults_correctly(self):
         cfg = {
             WILDTYPE: self.wt_cfg,
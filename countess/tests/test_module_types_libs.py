@@ -2,6 +2,7 @@ import os
 import sys
 import shutil
 import json
+import tempfile
 from unittest import TestCase
 
 from ..config.types import *
@@ -84,6 +85,19 @@ class BaseLibraryConfigTest(TestCase):
         with self.assertRaises(IOError):
             BaseLibraryConfiguration(cfg).validate()
 
+    def test_error_binary_or_empty_counts_file(self):
+        cfg = self.basic_cfg.copy()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cfg[COUNTS_FILE] = os.path.join(tmp_dir, "counts.tsv")
+            with open(cfg[COUNTS_FILE], "wb") as handle:
+                handle.write(b"\x89HDF\r\n\x1a\n\x00\x00\x00")
+            with self.assertRaises(IOError):
+                BaseLibraryConfiguration(cfg)
+
+            open(cfg[COUNTS_FILE], "w").close()
+            with self.assertRaises(IOError):
+                BaseLibraryConfiguration(cfg)
+
     def test_defaults_load_correctly(self):
         path = os.path.join(self.data_dir, "barcode_map.txt")
         cfg = self.basic_cfg.copy()
@@ -235,6 +249,11 @@ class BasicSeqLibConfigTest(TestCase):
             cfg.fastq_cfg.reads, os.path.join(self.data_dir, "polyA_t0.fq")
         )
 
+    def test_rejects_unknown_attributes(self):
+        cfg = BasicSeqLibConfiguration(self.basic_cfg, init_fastq=True)
+        with self.assertRaises(AttributeError):
+            cfg.not_an_option = True
+
 
 class IdOnlySeqlibTest(TestCase):
     def setUp(self):
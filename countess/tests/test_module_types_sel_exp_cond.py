@@ -374,3 +374,53 @@ class ExperimentConfigTest(TestCase):
             cfg.store_cfg.scorer_cfg.scorer_class_attrs,
             {"logr_method": "wt", "weighted": True},
         )
+
+    def test_bypass_validators_skips_validation(self):
+        cfg = {
+            NAME: "TestExperiment",
+            CONDITIONS: [self.condition_1_cfg, self.condition_1_cfg],
+            SCORER: self.scorer_cfg,
+        }
+        exp_cfg = ExperimentConfiguration(cfg, bypass_validators=True)
+        self.assertEqual(len(exp_cfg.condition_cfgs), 2)
+        with self.assertRaises(ValueError):
+            exp_cfg.validate()
+
+    def test_bypass_validators_skips_child_validation(self):
+        fastq_lib_cfg = {
+            NAME: "FastqLib",
+            TIMEPOINT: 0,
+            FASTQ: {READS: os.path.join(self.data_dir, "missing.fq")},
+            VARIANTS: {WILDTYPE: {SEQUENCE: "atg"}},
+        }
+        counts_lib_cfg = {
+            NAME: "CountsLib",
+            TIMEPOINT: 1,
+            IDENTIFIERS: {},
+            COUNTS_FILE: os.path.join(self.data_dir, "missing.tsv"),
+        }
+        selection_cfg = {
+            LIBRARIES: [fastq_lib_cfg, counts_lib_cfg],
+            NAME: "Selection_1",
+        }
+        cfg = {
+            NAME: "TestExperiment",
+            CONDITIONS: [{NAME: "Condition_1", SELECTIONS: [selection_cfg]}],
+            SCORER: {
+                SCORER_PATH: self.scorer_cfg[SCORER_PATH],
+                SCORER_OPTIONS: {"weighted": False},
+            },
+        }
+        exp_cfg = ExperimentConfiguration(cfg, bypass_validators=True)
+
+        # Values normalised by the scorer and wildtype are still set.
+        scorer_cfg = exp_cfg.store_cfg.scorer_cfg
+        self.assertEqual(scorer_cfg.scorer_class.name, "Regression")
+        self.assertEqual(
+            scorer_cfg.scorer_class_attrs, {"logr_method": "wt", "weighted": False}
+        )
+        lib_cfg = exp_cfg.condition_cfgs[0].selection_cfgs[0].lib_cfgs[0]
+        self.assertEqual(lib_cfg.variants_cfg.wildtype_cfg.sequence, "ATG")
+
+        with self.assertRaises(IOError):
+            exp_cfg.validate()
@@ -1,5 +1,6 @@
 import unittest
 
+from ..base.utils import translate_dna
 from ..sequence.wildtype import WildTypeSequence
 
 
@@ -41,6 +42,11 @@ class TestWildTypeModule(unittest.TestCase):
         wt.configure(cfg)
         self.assertTrue(wt.protein_seq == "KK")
 
+    def test_translate_dna_marks_invalid_codons(self):
+        self.assertEqual(translate_dna("ATGTGGTAA"), "MW*")
+        self.assertEqual(translate_dna("ATGNAATAAGG"), "M?*?")
+        self.assertEqual(translate_dna(""), "")
+
     def test_protein_sequence_loads_correctly_noncoding(self):
         cfg = make_cfg("AAAAAA", coding=False)
         wt = WildTypeSequence("Test")
@@ -145,6 +145,15 @@ def create_test_classes(store_interface):
             self.store.put("test_table", dd.from_pandas(data, npartitions=2))
             self.assertFalse(self.store.is_empty())
 
+        def test_contains(self) -> None:
+            index = pd.Index(["AAA", "AAC", "AAG"], name="index")
+            data = pd.DataFrame({"count": [1, 2, 3]}, index=index)
+
+            self.assertNotIn("test_table", self.store)
+
+            self.store.put("test_table", dd.from_pandas(data, npartitions=2))
+            self.assertIn("test_table", self.store)
+
     class TestStoreDrop(StoreInterfaceTest):
         def test_drop(self) -> None:
             index = pd.Index(["AAA", "AAC", "AAG"], name="index")
@@ -1,12 +1,154 @@
+import pathlib
+import tempfile
 import unittest
 
+import dask.dataframe as dd
+import pandas as pd
+
 from countess.store.hdf import HdfStore
 from tests.test_store.store_interface_tests import create_test_classes
 
 
+class TestHdfStoreCompression(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self._temp_dir.name, "temp.h5")
+        self.store = HdfStore(self.path, complib="blosc:lz4", complevel=5)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_put_compressed(self) -> None:
+        index = pd.Index(["AAA", "AAC", "AAG"], name="index")
+        data = pd.DataFrame({"count": [1, 2, 3]}, index=index)
+
+        self.store.put("test_table", dd.from_pandas(data, npartitions=2))
+        with pd.HDFStore(self.path, mode="r") as store:
+            filters = store.get_storer("test_table").table.filters
+        self.assertEqual(filters.complib, "blosc:lz4")
+        self.assertEqual(filters.complevel, 5)
+        result = self.store.get("test_table")
+        pd.testing.assert_frame_equal(
+            result.compute(), data, check_index_type=False
+        )
+
+    def test_file_metadata(self) -> None:
+        self.assertDictEqual(self.store.get_file_metadata(), {})
+        index = pd.Index(["AAA", "AAC", "AAG"], name="index")
+        data = pd.DataFrame({"count": [1, 2, 3]}, index=index)
+        self.store.put("test_table", dd.from_pandas(data, npartitions=2))
+
+        self.store.set_file_metadata({"cfg_hash": "0123456789abcdef"})
+        self.assertDictEqual(
+            self.store.get_file_metadata(), {"cfg_hash": "0123456789abcdef"}
+        )
+        self.assertListEqual(self.store.keys(), ["test_table"])
+        self.assertDictEqual(self.store.get_metadata("test_table"), {})
+        with self.assertRaises(TypeError):
+            self.store.set_file_metadata(["cfg_hash"])
+
+
+class TestHdfStoreIterMetadata(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self._temp_dir.name, "temp.h5")
+        self.store = HdfStore(self.path)
+        index = pd.Index(["AAA", "AAC", "AAG"], name="index")
+        data = dd.from_pandas(pd.DataFrame({"count": [1, 2, 3]}, index=index), 1)
+        self.store.put("table_1", data)
+        self.store.put("table_2", data)
+        self.store.set_metadata("table_1", {"a": 1})
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_iter_metadata(self) -> None:
+        expected = [("table_1", {"a": 1}), ("table_2", {})]
+        self.assertListEqual(list(self.store.iter_metadata()), expected)
+        self.assertListEqual(
+            list(self.store.iter_metadata(["table_2"])), [("table_2", {})]
+        )
+
+    def test_iter_metadata_missing_key(self) -> None:
+        with self.assertRaises(KeyError):
+            list(self.store.iter_metadata(["table_3"]))
+
+
+class TestHdfStoreTables(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self._temp_dir.name, "temp.h5")
+        self.store = HdfStore(self.path)
+        index = pd.Index(["AAA", "AAC", "AAG", "AAT"], name="index")
+        self.counts = pd.DataFrame({"count": [1, 2, 3, 4]}, index=index)
+        self.scores = pd.DataFrame({"score": [0.5, 1.5, 2.5, 3.5]}, index=index)
+        self.store.append("/main/counts", self.counts, data_columns=["count"])
+        self.store.append("main/scores", self.scores)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_leading_slash_keys(self) -> None:
+        self.assertListEqual(self.store.keys(), ["main/counts", "main/scores"])
+        self.assertIn("/main/counts", self.store)
+        self.assertIn("main/counts", self.store)
+        reloaded = HdfStore(self.path)
+        self.assertListEqual(reloaded.keys(), ["main/counts", "main/scores"])
+        self.store.drop("/main/scores")
+        self.assertNotIn("main/scores", self.store)
+
+    def test_append_existing_table(self) -> None:
+        more = pd.DataFrame({"count": [5]}, index=pd.Index(["ACA"], name="index"))
+        self.store.append("main/counts", more)
+        pd.testing.assert_frame_equal(
+            self.store.select("main/counts"), pd.concat([self.counts, more])
+        )
+
+    def test_select(self) -> None:
+        pd.testing.assert_frame_equal(self.store.select("main/counts"), self.counts)
+        pd.testing.assert_frame_equal(
+            self.store.select("main/counts", start=1, stop=3), self.counts.iloc[1:3]
+        )
+        pd.testing.assert_frame_equal(
+            self.store.select("main/counts", where="count > 2"),
+            self.counts[self.counts["count"] > 2],
+        )
+        with self.assertRaises(KeyError):
+            self.store.select("main/missing")
+
+    def test_select_as_multiple(self) -> None:
+        coords = self.store.select_as_coordinates("main/counts", "count > 2")
+        self.assertListEqual(list(coords), [2, 3])
+        result = self.store.select_as_multiple(
+            ["main/counts", "main/scores"], selector="main/counts", where=coords
+        )
+        expected = pd.concat([self.counts, self.scores], axis="columns").iloc[2:]
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_get_column_index(self) -> None:
+        self.assertListEqual(
+            list(self.store.get_column("main/counts", "index")),
+            list(self.counts.index),
+        )
+
+    def test_table_info(self) -> None:
+        info = self.store.table_info("main/counts", attrs=("max_index_len",))
+        self.assertEqual(info["nrows"], 4)
+        self.assertGreater(info["rowsize"], 0)
+        self.assertIsNone(info["max_index_len"])
+        self.store.set_table_attr("main/counts", "max_index_len", 3)
+        info = self.store.table_info("main/counts", attrs=("max_index_len",))
+        self.assertEqual(info["max_index_len"], 3)
+        self.assertDictEqual(self.store.get_metadata("main/counts"), {})
+
+
 def load_tests(loader, tests, pattern) -> unittest.TestSuite:
     suite = unittest.TestSuite()
-    test_classes = create_test_classes(HdfStore)
+    test_classes = create_test_classes(HdfStore) + (
+        TestHdfStoreCompression,
+        TestHdfStoreIterMetadata,
+        TestHdfStoreTables,
+    )
     for tc in test_classes:
         tc.__module__ = __name__
         tc.__qualname__ = tc.__name__